@@ -0,0 +1,370 @@
+"""
+Minecraft SeedFinder - Streaming result exporters
+"""
+import csv
+import json
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, List
+
+
+# Binary record format (.sfr): an 8 byte header followed by fixed-width records
+BINARY_MAGIC = b"SFRB"
+BINARY_FORMAT_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sHH")
+BINARY_RECORD = struct.Struct("<qqiiiI32s")
+
+# Bytes read at a time while looking for the last complete line
+TAIL_CHUNK = 65536
+
+FLAG_CLUSTER = 1
+FLAG_SEED_48BIT = 2
+
+CSV_FIELDS = ['seed', 'x', 'z', 'house_count', 'biome', 'is_cluster', 'seed_48bit']
+
+
+class ResultExporter:
+    """Base class for exporters that write results incrementally"""
+
+    extension = ""
+    binary = False
+
+    def __init__(self, path: str, append: bool = False, batch_size: int = 256):
+        """
+        Open an exporter
+
+        Args:
+            path: Output file path
+            append: Resume an existing file instead of truncating it
+            batch_size: Number of results buffered before writing
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.count = 0
+        self._buffer = []
+
+        resuming = append and os.path.exists(path) and os.path.getsize(path) > 0
+        if resuming:
+            # A file without one complete line is started over, header included
+            resuming = self._trim_partial_tail() > 0
+
+        mode = ('ab' if resuming else 'wb') if self.binary else ('a' if resuming else 'w')
+        if self.binary:
+            self._file = open(path, mode)
+        else:
+            self._file = open(path, mode, newline='', encoding='utf-8')
+
+        if not resuming:
+            self._write_header()
+
+    def write(self, result: dict):
+        """Queue a single result for writing"""
+        self._buffer.append(result)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, results: Iterable[dict]):
+        """Queue several results for writing"""
+        for result in results:
+            self.write(result)
+
+    def flush(self):
+        """Write buffered results and flush them to disk"""
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self.count += len(self._buffer)
+            self._buffer = []
+        self._file.flush()
+
+    def close(self):
+        """Flush remaining results and close the file"""
+        if self._file.closed:
+            return
+        self.flush()
+        self._write_footer()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _trim_partial_tail(self) -> int:
+        """Drop a trailing partial line left behind by an interrupted run, returning the new size"""
+        with open(self.path, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+
+            # Scan backwards for the end of the last complete line
+            keep, end = 0, size
+            while end > 0:
+                start = max(0, end - TAIL_CHUNK)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline >= 0:
+                    keep = start + newline + 1
+                    break
+                end = start
+
+            if keep < size:
+                f.truncate(keep)
+            return keep
+
+    def _write_header(self):
+        pass
+
+    def _write_footer(self):
+        pass
+
+    def _write_batch(self, batch: List[dict]):
+        raise NotImplementedError
+
+
+class JSONExporter(ResultExporter):
+    """Exporter for the legacy JSON array format (cannot be resumed)"""
+
+    extension = ".json"
+
+    def __init__(self, path: str, append: bool = False, batch_size: int = 256):
+        if append:
+            raise ValueError("JSON array exports cannot be appended to, use JSONL instead")
+        self._first = True
+        super().__init__(path, append=False, batch_size=batch_size)
+
+    def _write_header(self):
+        self._file.write("[\n")
+
+    def _write_batch(self, batch: List[dict]):
+        for result in batch:
+            if not self._first:
+                self._file.write(",\n")
+            self._file.write(json.dumps(result))
+            self._first = False
+
+    def _write_footer(self):
+        self._file.write("\n]\n")
+
+
+class JSONLExporter(ResultExporter):
+    """Exporter writing one JSON object per line"""
+
+    extension = ".jsonl"
+
+    def _write_batch(self, batch: List[dict]):
+        self._file.write("".join(json.dumps(result) + "\n" for result in batch))
+
+
+class CSVExporter(ResultExporter):
+    """Exporter writing comma separated values with a header row"""
+
+    extension = ".csv"
+
+    def _write_header(self):
+        csv.writer(self._file).writerow(CSV_FIELDS)
+
+    def _write_batch(self, batch: List[dict]):
+        writer = csv.writer(self._file)
+        writer.writerows(
+            ['' if result.get(field) is None else result[field] for field in CSV_FIELDS]
+            for result in batch
+        )
+
+
+class BinaryExporter(ResultExporter):
+    """Exporter writing fixed-width binary records"""
+
+    extension = ".sfr"
+    binary = True
+
+    def _trim_partial_tail(self) -> int:
+        """Validate the header and drop a trailing partial record"""
+        size = os.path.getsize(self.path)
+        with open(self.path, 'rb+') as f:
+            _check_binary_header(f.read(BINARY_HEADER.size), self.path)
+            records = (size - BINARY_HEADER.size) // BINARY_RECORD.size
+            keep = BINARY_HEADER.size + records * BINARY_RECORD.size
+            f.truncate(keep)
+        return keep
+
+    def _write_header(self):
+        self._file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_FORMAT_VERSION,
+                                            BINARY_RECORD.size))
+
+    def _write_batch(self, batch: List[dict]):
+        self._file.write(b"".join(pack_record(result) for result in batch))
+
+
+EXPORTERS = {
+    exporter.extension: exporter
+    for exporter in (JSONExporter, JSONLExporter, CSVExporter, BinaryExporter)
+}
+
+
+def get_exporter(path: str, append: bool = False, batch_size: int = 256) -> ResultExporter:
+    """
+    Create an exporter based on the file extension
+
+    Args:
+        path: Output file path (.json, .jsonl, .csv or .sfr)
+        append: Resume an existing file instead of truncating it
+        batch_size: Number of results buffered before writing
+
+    Returns:
+        Exporter instance
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXPORTERS:
+        raise ValueError(f"Unsupported export format: {extension or path}")
+    return EXPORTERS[extension](path, append=append, batch_size=batch_size)
+
+
+def pack_record(result: dict) -> bytes:
+    """Pack a result dictionary into a fixed-width binary record"""
+    return BINARY_RECORD.pack(*_record_fields(result))
+
+
+def pack_record_into(buffer, offset: int, result: dict):
+    """Pack a result dictionary directly into a writable buffer"""
+    BINARY_RECORD.pack_into(buffer, offset, *_record_fields(result))
+
+
+def _record_fields(result: dict) -> tuple:
+    flags = 0
+    if result.get('is_cluster'):
+        flags |= FLAG_CLUSTER
+    seed_48bit = result.get('seed_48bit')
+    if seed_48bit is not None:
+        flags |= FLAG_SEED_48BIT
+
+    return (
+        result['seed'],
+        seed_48bit if seed_48bit is not None else -1,
+        result['x'],
+        result['z'],
+        result['house_count'],
+        flags,
+        str(result.get('biome', '')).encode('utf-8')[:32]
+    )
+
+
+def unpack_record(seed, seed_48bit, x, z, house_count, flags, biome) -> dict:
+    """Turn unpacked binary record fields back into a result dictionary"""
+    result = {
+        'seed': seed,
+        'x': x,
+        'z': z,
+        'house_count': house_count,
+        'biome': biome.rstrip(b"\0").decode('utf-8', 'replace')
+    }
+    if flags & FLAG_CLUSTER:
+        result['is_cluster'] = True
+    if flags & FLAG_SEED_48BIT:
+        result['seed_48bit'] = seed_48bit
+        result['full_seed'] = None
+    return result
+
+
+def _check_binary_header(header: bytes, path: str):
+    """Raise ValueError unless header belongs to a compatible binary export"""
+    if len(header) < BINARY_HEADER.size:
+        raise ValueError(f"Not a SeedFinder binary export: {path}")
+    magic, version, record_size = BINARY_HEADER.unpack(header)
+    if magic != BINARY_MAGIC or record_size != BINARY_RECORD.size:
+        raise ValueError(f"Not a SeedFinder binary export: {path}")
+    if version != BINARY_FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary export version {version}: {path}")
+
+
+def binary_dtype():
+    """NumPy structured dtype matching the binary record layout"""
+    import numpy as np
+
+    return np.dtype([
+        ('seed', '<i8'),
+        ('seed_48bit', '<i8'),
+        ('x', '<i4'),
+        ('z', '<i4'),
+        ('house_count', '<i4'),
+        ('flags', '<u4'),
+        ('biome', 'S32')
+    ])
+
+
+def read_binary_results(path: str):
+    """
+    Memory-map a binary export without copying it
+
+    Args:
+        path: Path to a .sfr file
+
+    Returns:
+        Read-only NumPy structured array backed by the file
+    """
+    import numpy as np
+
+    with open(path, 'rb') as f:
+        _check_binary_header(f.read(BINARY_HEADER.size), path)
+
+    records = (os.path.getsize(path) - BINARY_HEADER.size) // BINARY_RECORD.size
+    if records == 0:
+        return np.empty(0, dtype=binary_dtype())
+    return np.memmap(path, dtype=binary_dtype(), mode='r',
+                     offset=BINARY_HEADER.size, shape=(records,))
+
+
+def iter_binary_results(path: str) -> Iterator[dict]:
+    """Iterate over a binary export as result dictionaries"""
+    with open(path, 'rb') as f:
+        _check_binary_header(f.read(BINARY_HEADER.size), path)
+        if os.fstat(f.fileno()).st_size <= BINARY_HEADER.size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            records = (len(view) - BINARY_HEADER.size) // BINARY_RECORD.size
+            end = BINARY_HEADER.size + records * BINARY_RECORD.size
+            try:
+                for fields in BINARY_RECORD.iter_unpack(view[BINARY_HEADER.size:end]):
+                    yield unpack_record(*fields)
+            finally:
+                view.release()
+
+
+def load_results(path: str) -> List[dict]:
+    """
+    Load results written by any exporter
+
+    Args:
+        path: Path to a .json, .jsonl, .csv or .sfr export
+
+    Returns:
+        List of result dictionaries
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".sfr":
+        return list(iter_binary_results(path))
+
+    with open(path, newline='', encoding='utf-8') as f:
+        if extension == ".jsonl":
+            return [json.loads(line) for line in f if line.strip()]
+        if extension == ".csv":
+            return [_parse_csv_row(row) for row in csv.DictReader(f)]
+        return json.load(f)
+
+
+def _parse_csv_row(row: dict) -> dict:
+    """Convert a CSV row back into a typed result dictionary"""
+    result = {
+        'seed': int(row['seed']),
+        'x': int(row['x']),
+        'z': int(row['z']),
+        'house_count': int(row['house_count']),
+        'biome': row['biome']
+    }
+    if row.get('is_cluster') == 'True':
+        result['is_cluster'] = True
+    if row.get('seed_48bit'):
+        result['seed_48bit'] = int(row['seed_48bit'])
+        result['full_seed'] = None
+    return result
@@ -0,0 +1,566 @@
+"""
+Minecraft SeedFinder - Professional GUI Application
+"""
+from PyQt5.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSpinBox, QComboBox, QTextEdit, QProgressBar, QFileDialog,
+    QGroupBox, QFormLayout, QCheckBox, QMessageBox
+)
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal, Qt
+from PyQt5.QtGui import QFont, QPalette, QColor
+import os
+import re
+import threading
+from seedfinder import SeedFinder, FastSeedFinder, SequentialRunner
+from exporters import EXPORTERS, get_exporter
+from score_cache import ScoreCache, default_cache_path
+from ledger import CoverageLedger, default_ledger_path
+from metrics import SearchMetrics, MetricsServer
+from pipeline import PipelineRunner
+from scheduler import AdaptiveScheduler
+from live_results import ResultRing
+
+
+EXPORT_FILTERS = (
+    "JSON Lines (*.jsonl);;CSV Files (*.csv);;"
+    "SeedFinder Binary (*.sfr);;JSON Files (*.json)"
+)
+
+# Range of Minecraft (Java long) seeds
+SEED_MIN = -(1 << 63)
+SEED_MAX = (1 << 63) - 1
+
+# Live results are polled from the shared-memory ring at this interval
+LIVE_POLL_INTERVAL_MS = 200
+LIVE_POLL_LIMIT = 500
+
+
+def format_result(result):
+    """Format a result for the results text area"""
+    info = f"Seed: {result['seed']}\n"
+    info += f"  Location: ({result['x']}, {result['z']})\n"
+    info += f"  Houses: {result['house_count']}\n"
+    info += f"  Biome: {result['biome']}\n"
+    
+    if result.get('is_cluster'):
+        info += "  [Village Cluster]\n"
+    
+    info += "-" * 60 + "\n"
+    return info
+
+
+def with_export_extension(file_path, selected_filter):
+    """Add the selected filter's extension unless the name has a supported one"""
+    if os.path.splitext(file_path)[1].lower() in EXPORTERS:
+        return file_path
+    match = re.search(r"\*(\.\w+)", selected_filter or "")
+    return file_path + (match.group(1) if match else ".jsonl")
+
+
+class SearchThread(QThread):
+    """Thread for running seed search without blocking GUI"""
+    
+    progress_signal = pyqtSignal(float, int)
+    finished_signal = pyqtSignal(list)
+    error_signal = pyqtSignal(str)
+    
+    def __init__(self, finder, start_seed, end_seed, min_houses, max_spacing, 
+                 search_radius, fast_mode=False, exporter=None, ledger=None,
+                 runner=None, ring=None):
+        super().__init__()
+        self.finder = finder
+        self.start_seed = start_seed
+        self.end_seed = end_seed
+        self.min_houses = min_houses
+        self.max_spacing = max_spacing
+        self.search_radius = search_radius
+        self.fast_mode = fast_mode
+        self.exporter = exporter
+        self.ledger = ledger
+        self.runner = runner
+        self.ring = ring
+        self.skipped = 0
+    
+    def run(self):
+        result_callback = self.publish_results if self.exporter or self.ring else None
+        
+        try:
+            if self.ledger is not None:
+                self.skipped = self.finder.count_searched(
+                    self.ledger, self.start_seed, self.end_seed,
+                    self.min_houses, self.max_spacing, self.search_radius,
+                    "48bit" if self.fast_mode else "full"
+                )
+            
+            if self.fast_mode:
+                results = self.finder.search_lower_48_bits(
+                    self.start_seed, self.end_seed,
+                    self.min_houses, self.max_spacing, self.search_radius,
+                    self.progress_callback, result_callback, self.ledger, self.runner
+                )
+            else:
+                results = self.finder.search_seeds(
+                    self.start_seed, self.end_seed,
+                    self.min_houses, self.max_spacing, self.search_radius,
+                    self.progress_callback, result_callback, self.ledger, self.runner
+                )
+            self.finished_signal.emit(results)
+        except Exception as e:
+            self.error_signal.emit(str(e))
+        finally:
+            if self.exporter:
+                self.exporter.close()
+    
+    def progress_callback(self, progress, result_count):
+        self.progress_signal.emit(progress, result_count)
+    
+    def publish_results(self, results):
+        if self.exporter:
+            self.exporter.write_many(results)
+        if self.ring:
+            self.ring.push_many(results)
+
+
+class SeedFinderGUI(QMainWindow):
+    """Main GUI window for SeedFinder"""
+    
+    def __init__(self):
+        super().__init__()
+        self.finder = None
+        self.search_thread = None
+        self.score_cache = None
+        self.metrics = None
+        self.metrics_server = None
+        self.live_ring = None
+        self.stop_event = threading.Event()
+        self.live_timer = QTimer(self)
+        self.live_timer.setInterval(LIVE_POLL_INTERVAL_MS)
+        self.live_timer.timeout.connect(self.poll_live_results)
+        self.results = []
+        self.init_ui()
+        self.apply_theme()
+        self.start_metrics_server()
+    
+    def start_metrics_server(self):
+        """Serve search metrics on localhost if SEEDFINDER_METRICS_PORT is set"""
+        port = os.environ.get("SEEDFINDER_METRICS_PORT")
+        if not port:
+            return
+        
+        try:
+            self.metrics = SearchMetrics()
+            self.metrics_server = MetricsServer(self.metrics, int(port)).start()
+            self.status_label.setText(f"Ready (metrics at {self.metrics_server.url})")
+        except (OSError, ValueError) as e:
+            self.metrics = None
+            self.metrics_server = None
+            self.status_label.setText(f"Error starting metrics server: {str(e)}")
+    
+    def init_ui(self):
+        """Initialize the user interface"""
+        self.setWindowTitle("SeedFinder - Minecraft Mega-Village Search Tool")
+        self.setGeometry(100, 100, 900, 700)
+        
+        # Create central widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # Main layout
+        main_layout = QVBoxLayout()
+        central_widget.setLayout(main_layout)
+        
+        # Configuration group
+        config_group = QGroupBox("Configuration")
+        config_layout = QFormLayout()
+        
+        # Minecraft version
+        self.version_combo = QComboBox()
+        self.version_combo.addItems([
+            "1.20.4", "1.20.1", "1.20", "1.19.4", "1.19.3", 
+            "1.19.2", "1.19.1", "1.19", "1.18.2", "1.18.1", "1.18"
+        ])
+        self.version_combo.setCurrentText("1.20.4")
+        config_layout.addRow("Minecraft Version:", self.version_combo)
+        
+        # Seed range
+        seed_layout = QHBoxLayout()
+        self.start_seed_input = QLineEdit("0")
+        self.start_seed_input.setPlaceholderText("Start seed")
+        self.end_seed_input = QLineEdit("1000000")
+        self.end_seed_input.setPlaceholderText("End seed")
+        seed_layout.addWidget(self.start_seed_input)
+        seed_layout.addWidget(self.end_seed_input)
+        config_layout.addRow("Seed Range:", seed_layout)
+        
+        # House count threshold
+        self.min_houses_spin = QSpinBox()
+        self.min_houses_spin.setRange(10, 500)
+        self.min_houses_spin.setValue(100)
+        self.min_houses_spin.setSuffix(" houses")
+        config_layout.addRow("Minimum Houses:", self.min_houses_spin)
+        
+        # Max spacing
+        self.max_spacing_spin = QSpinBox()
+        self.max_spacing_spin.setRange(10, 100)
+        self.max_spacing_spin.setValue(25)
+        self.max_spacing_spin.setSuffix(" blocks")
+        config_layout.addRow("Max Spacing:", self.max_spacing_spin)
+        
+        # Search radius
+        self.search_radius_spin = QSpinBox()
+        self.search_radius_spin.setRange(1000, 20000)
+        self.search_radius_spin.setValue(5000)
+        self.search_radius_spin.setSuffix(" blocks")
+        config_layout.addRow("Search Radius:", self.search_radius_spin)
+        
+        # Fast mode checkbox
+        self.fast_mode_check = QCheckBox("Use Fast Mode (48-bit search)")
+        self.fast_mode_check.setChecked(True)
+        self.fast_mode_check.setToolTip(
+            "Searches only lower 48 bits of seed (65536x faster). "
+            "Full seed can be recovered later."
+        )
+        config_layout.addRow("", self.fast_mode_check)
+        
+        # Execution strategy
+        self.execution_combo = QComboBox()
+        self.execution_combo.addItems(["Sequential", "Pipelined stages", "Parallel processes"])
+        self.execution_combo.setToolTip(
+            "Pipelined stages overlap position, viability and scoring work "
+            "across seeds using worker threads. Parallel processes spread "
+            "adaptively sized chunks over all CPU cores."
+        )
+        config_layout.addRow("Execution:", self.execution_combo)
+        
+        # Streaming export checkbox
+        self.stream_check = QCheckBox("Stream results to file")
+        self.stream_check.setChecked(False)
+        self.stream_check.setToolTip(
+            "Writes results as they are found. Choosing an existing "
+            "JSONL, CSV or binary file resumes it by appending."
+        )
+        config_layout.addRow("", self.stream_check)
+        
+        # Coverage ledger checkbox
+        self.skip_searched_check = QCheckBox("Skip seeds already searched")
+        self.skip_searched_check.setChecked(True)
+        self.skip_searched_check.setToolTip(
+            "Skips seeds previously searched with the same version and "
+            "parameters, as recorded in the coverage ledger."
+        )
+        config_layout.addRow("", self.skip_searched_check)
+        
+        config_group.setLayout(config_layout)
+        main_layout.addWidget(config_group)
+        
+        # Search buttons
+        button_layout = QHBoxLayout()
+        self.start_button = QPushButton("Start Search")
+        self.start_button.clicked.connect(self.start_search)
+        self.stop_button = QPushButton("Stop")
+        self.stop_button.clicked.connect(self.stop_search)
+        self.stop_button.setEnabled(False)
+        button_layout.addWidget(self.start_button)
+        button_layout.addWidget(self.stop_button)
+        main_layout.addLayout(button_layout)
+        
+        # Progress bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setValue(0)
+        main_layout.addWidget(self.progress_bar)
+        
+        # Status label
+        self.status_label = QLabel("Ready")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(self.status_label)
+        
+        # Results group
+        results_group = QGroupBox("Results")
+        results_layout = QVBoxLayout()
+        
+        # Results counter
+        self.results_label = QLabel("Results: 0 found")
+        results_layout.addWidget(self.results_label)
+        
+        # Results text area
+        self.results_text = QTextEdit()
+        self.results_text.setReadOnly(True)
+        self.results_text.setFont(QFont("Courier New", 9))
+        results_layout.addWidget(self.results_text)
+        
+        # Export button
+        self.export_button = QPushButton("Export Results")
+        self.export_button.clicked.connect(self.export_results)
+        self.export_button.setEnabled(False)
+        results_layout.addWidget(self.export_button)
+        
+        results_group.setLayout(results_layout)
+        main_layout.addWidget(results_group)
+    
+    def apply_theme(self):
+        """Apply minimalistic dark theme"""
+        palette = QPalette()
+        
+        # Colors
+        bg_color = QColor(30, 30, 30)
+        fg_color = QColor(220, 220, 220)
+        accent_color = QColor(70, 130, 180)
+        
+        palette.setColor(QPalette.Window, bg_color)
+        palette.setColor(QPalette.WindowText, fg_color)
+        palette.setColor(QPalette.Base, QColor(40, 40, 40))
+        palette.setColor(QPalette.AlternateBase, bg_color)
+        palette.setColor(QPalette.ToolTipBase, fg_color)
+        palette.setColor(QPalette.ToolTipText, fg_color)
+        palette.setColor(QPalette.Text, fg_color)
+        palette.setColor(QPalette.Button, QColor(50, 50, 50))
+        palette.setColor(QPalette.ButtonText, fg_color)
+        palette.setColor(QPalette.BrightText, QColor(255, 0, 0))
+        palette.setColor(QPalette.Link, accent_color)
+        palette.setColor(QPalette.Highlight, accent_color)
+        palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
+        
+        self.setPalette(palette)
+    
+    def start_search(self):
+        """Start the seed search"""
+        try:
+            # Get parameters
+            mc_version = self.version_combo.currentText()
+            start_seed = int(self.start_seed_input.text())
+            end_seed = int(self.end_seed_input.text())
+            min_houses = self.min_houses_spin.value()
+            max_spacing = self.max_spacing_spin.value()
+            search_radius = self.search_radius_spin.value()
+            fast_mode = self.fast_mode_check.isChecked()
+            
+            # Validate inputs
+            if start_seed >= end_seed:
+                self.status_label.setText("Error: Start seed must be less than end seed")
+                return
+            if start_seed < SEED_MIN or end_seed > SEED_MAX + 1:
+                # Minecraft seeds are signed 64-bit, as are exported seed fields
+                self.status_label.setText(
+                    f"Error: Seeds must be between {SEED_MIN} and {SEED_MAX}"
+                )
+                return
+            
+            # Open the persistent score cache on first use
+            if self.score_cache is None:
+                self.score_cache = ScoreCache(default_cache_path())
+            
+            # Load the coverage ledger to skip already searched seeds
+            ledger = None
+            if self.skip_searched_check.isChecked():
+                ledger = CoverageLedger(default_ledger_path())
+            
+            # Open streaming exporter if requested
+            exporter = None
+            if self.stream_check.isChecked():
+                exporter = self.open_stream_exporter()
+                if exporter is None:
+                    return
+                if ledger is not None:
+                    ledger.before_save = exporter.flush
+            
+            # Live results arrive through a shared-memory ring, worker
+            # processes publish to it directly
+            self.close_live_ring()
+            self.live_ring = ResultRing()
+            thread_ring = self.live_ring
+            
+            # Runners check the stop event so Stop can end the search cleanly
+            self.stop_event = threading.Event()
+            execution = self.execution_combo.currentText()
+            if execution == "Pipelined stages":
+                runner = PipelineRunner(stop=self.stop_event)
+            elif execution == "Parallel processes":
+                runner = AdaptiveScheduler(ring=self.live_ring, stop=self.stop_event)
+                thread_ring = None
+            else:
+                runner = SequentialRunner(stop=self.stop_event)
+            
+            # Initialize finder
+            finder_class = FastSeedFinder if fast_mode else SeedFinder
+            self.finder = finder_class(mc_version, self.score_cache, self.metrics)
+            
+            # Clear previous results
+            self.results = []
+            self.results_text.clear()
+            self.results_label.setText("Results: 0 found")
+            
+            # Create and start search thread
+            self.search_thread = SearchThread(
+                self.finder, start_seed, end_seed,
+                min_houses, max_spacing, search_radius, fast_mode, exporter, ledger,
+                runner, thread_ring
+            )
+            self.search_thread.progress_signal.connect(self.update_progress)
+            self.search_thread.finished_signal.connect(self.search_finished)
+            self.search_thread.error_signal.connect(self.search_error)
+            self.search_thread.finished.connect(self.search_thread_finished)
+            
+            # Update UI state
+            self.start_button.setEnabled(False)
+            self.stop_button.setEnabled(True)
+            self.export_button.setEnabled(False)
+            self.progress_bar.setValue(0)
+            self.status_label.setText("Searching...")
+            
+            self.search_thread.start()
+            self.live_timer.start()
+            
+        except ValueError:
+            self.status_label.setText("Error: Please enter valid seed numbers")
+        except Exception as e:
+            self.status_label.setText(f"Error: {str(e)}")
+    
+    def stop_search(self):
+        """Stop the current search, keeping the results found so far"""
+        if self.search_thread and self.search_thread.isRunning():
+            self.stop_button.setEnabled(False)
+            self.status_label.setText("Stopping...")
+            # Seeds in flight finish, then the thread reports the results so
+            # far, saves coverage and closes the exporter without blocking the UI
+            self.stop_event.set()
+    
+    def closeEvent(self, event):
+        """Stop a running search and wait for its exporter and ledger to be written out"""
+        if self.search_thread is not None:
+            self.stop_search()
+            self.search_thread.wait()
+            self.close_live_ring()
+        super().closeEvent(event)
+    
+    def update_progress(self, progress, result_count):
+        """Update progress bar and status"""
+        self.progress_bar.setValue(int(progress))
+        if not self.stop_event.is_set():
+            self.status_label.setText(f"Searching... {result_count} results found")
+        self.results_label.setText(f"Results: {result_count} found")
+    
+    def poll_live_results(self):
+        """Render results published to the live ring since the last poll"""
+        if self.live_ring is None:
+            return
+        
+        for result in self.live_ring.poll(LIVE_POLL_LIMIT):
+            self.results_text.append(format_result(result))
+        
+        dropped = self.live_ring.dropped
+        if dropped:
+            self.results_label.setText(
+                f"Results: {self.live_ring.written} shown live, {dropped} more "
+                "will be listed when the search completes"
+            )
+    
+    def close_live_ring(self):
+        """Stop polling and release the live result ring"""
+        self.live_timer.stop()
+        if self.live_ring is not None:
+            self.live_ring.close()
+            self.live_ring = None
+    
+    def search_thread_finished(self):
+        """Release the live ring and allow a new search once the thread is done"""
+        # Worker processes publishing to the ring have exited by now
+        self.close_live_ring()
+        self.start_button.setEnabled(True)
+    
+    def search_finished(self, results):
+        """Handle search completion"""
+        # The full list replaces live results, polling would only duplicate them
+        self.live_timer.stop()
+        self.results = results
+        
+        # Update results display
+        self.results_text.clear()
+        
+        for result in results:
+            self.results_text.append(format_result(result))
+        
+        # Update UI state
+        self.stop_button.setEnabled(False)
+        self.export_button.setEnabled(True)
+        if self.stop_event.is_set():
+            status = f"Search stopped: {len(results)} results found"
+        else:
+            status = f"Search complete: {len(results)} results found"
+            self.progress_bar.setValue(100)
+        if self.search_thread.skipped:
+            # The ledger records coverage, not results, so skipped seeds show nothing
+            status += (f" ({self.search_thread.skipped} seeds skipped as already "
+                       "searched, results from earlier runs are not shown)")
+        self.status_label.setText(status)
+        
+        # Initial commit
+        self.commit_changes("Initial commit: SeedFinder GUI application")
+    
+    def search_error(self, error_message):
+        """Handle search error"""
+        # Keep the results found before the error on screen
+        self.poll_live_results()
+        self.live_timer.stop()
+        self.status_label.setText(f"Error: {error_message}")
+        self.stop_button.setEnabled(False)
+    
+    def open_stream_exporter(self):
+        """Ask for a streaming output file and open an exporter for it"""
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Stream Results To", "seedfinder_results.jsonl", EXPORT_FILTERS,
+            options=QFileDialog.DontConfirmOverwrite
+        )
+        
+        if not file_path:
+            return None
+        file_path = with_export_extension(file_path, selected_filter)
+        
+        # JSON arrays cannot be resumed, so an existing one would be replaced
+        exists = os.path.exists(file_path)
+        is_json = file_path.lower().endswith(".json")
+        if exists and is_json:
+            answer = QMessageBox.question(
+                self, "Replace File",
+                f"{os.path.basename(file_path)} already exists and JSON exports "
+                "cannot be resumed. Replace it?"
+            )
+            if answer != QMessageBox.Yes:
+                return None
+        
+        try:
+            return get_exporter(file_path, append=exists and not is_json)
+        except (OSError, ValueError) as e:
+            self.status_label.setText(f"Error opening export file: {str(e)}")
+            return None
+    
+    def export_results(self):
+        """Export results to a JSON, JSONL, CSV or binary file"""
+        if not self.results:
+            return
+        
+        try:
+            file_path, selected_filter = QFileDialog.getSaveFileName(
+                self, "Save Results", "seedfinder_results.jsonl", EXPORT_FILTERS
+            )
+            
+            if file_path:
+                file_path = with_export_extension(file_path, selected_filter)
+                with get_exporter(file_path) as exporter:
+                    exporter.write_many(self.results)
+                
+                self.status_label.setText(f"Results exported to {file_path}")
+                
+        except Exception as e:
+            self.status_label.setText(f"Error exporting results: {str(e)}")
+    
+    def commit_changes(self, message):
+        """Commit changes to git"""
+        import subprocess
+        
+        try:
+            subprocess.run(['git', 'add', '.'], check=True)
+            subprocess.run(['git', 'commit', '-m', message], check=True)
+        except subprocess.CalledProcessError as e:
+            print(f"Git commit failed: {e}")
+        except FileNotFoundError:
+            print("Git not found")
@@ -0,0 +1,457 @@
+"""
+Minecraft SeedFinder - Ledger of already-searched seeds
+"""
+import argparse
+import base64
+import bisect
+import contextlib
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+LEDGER_FORMAT_VERSION = 2
+
+# Seconds to wait for another process's lock, and age after which a lock is stale
+LOCK_TIMEOUT = 10.0
+STALE_LOCK_AGE = 60.0
+
+
+def default_ledger_path() -> str:
+    """Default location of the coverage ledger in the user's home directory"""
+    return os.path.join(os.path.expanduser("~"), ".seedfinder", "ledger.json")
+
+
+def ledger_key(mode: str, mc_version: str, min_houses: int, max_spacing: int,
+               search_radius: int) -> str:
+    """Key identifying a version and parameter set in the ledger"""
+    return f"{mode}:{mc_version}:{min_houses}:{max_spacing}:{search_radius}"
+
+
+class IntervalSet:
+    """Set of seeds stored as sorted, disjoint half-open ranges"""
+
+    def __init__(self, ranges: Optional[List[Tuple[int, int]]] = None):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        for start, end in ranges or []:
+            self.add(start, end)
+
+    def add(self, start: int, end: int):
+        """Add the range [start, end), merging overlapping or adjacent ranges"""
+        if start >= end:
+            return
+
+        # Fast path for ranges extending the last interval, the common case
+        if self._ends and self._starts[-1] <= start <= self._ends[-1]:
+            self._ends[-1] = max(self._ends[-1], end)
+            return
+
+        lo = bisect.bisect_left(self._ends, start)
+        hi = bisect.bisect_right(self._starts, end)
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+
+    def update(self, other: "IntervalSet"):
+        """Add every range of another set"""
+        for start, end in other:
+            self.add(start, end)
+
+    def __contains__(self, seed: int) -> bool:
+        i = bisect.bisect_right(self._starts, seed) - 1
+        return i >= 0 and seed < self._ends[i]
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(zip(self._starts, self._ends))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def gaps(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """Ranges within [start, end) that are not in the set"""
+        gaps = []
+        cursor = start
+        i = max(0, bisect.bisect_right(self._starts, start) - 1)
+
+        while cursor < end and i < len(self._starts):
+            if self._ends[i] <= cursor:
+                i += 1
+                continue
+            if self._starts[i] >= end:
+                break
+            if self._starts[i] > cursor:
+                gaps.append((cursor, self._starts[i]))
+            cursor = self._ends[i]
+            i += 1
+
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def covered(self) -> int:
+        """Total number of seeds in the set"""
+        return sum(end - start for start, end in self)
+
+
+class BloomFilter:
+    """Bloom filter for individual seeds that do not form ranges"""
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 1e-6,
+                 size_bits: Optional[int] = None, num_hashes: Optional[int] = None):
+        """
+        Create an empty filter
+
+        Args:
+            capacity: Expected number of seeds
+            error_rate: Acceptable false positive rate
+            size_bits: Explicit bit count, overrides capacity/error_rate
+            num_hashes: Explicit hash count, overrides capacity/error_rate
+        """
+        if size_bits is None or num_hashes is None:
+            default_bits, default_hashes = self.parameters(capacity, error_rate)
+            size_bits = default_bits if size_bits is None else size_bits
+            num_hashes = default_hashes if num_hashes is None else num_hashes
+
+        self.size_bits = max(8, size_bits)
+        self.num_hashes = num_hashes
+        self.count = 0
+        self._bits = bytearray((self.size_bits + 7) // 8)
+
+    @staticmethod
+    def parameters(capacity: int, error_rate: float) -> Tuple[int, int]:
+        """Bit and hash counts for a capacity and false positive rate"""
+        size_bits = int(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        return max(8, size_bits), max(1, round(size_bits / capacity * math.log(2)))
+
+    def _positions(self, seed: int) -> Iterator[int]:
+        digest = hashlib.blake2b(seed.to_bytes(8, 'little', signed=True), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, seed: int):
+        """Record a seed"""
+        for position in self._positions(seed):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, seed: int) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(seed))
+
+    def update(self, other: "BloomFilter"):
+        """Merge another filter with identical parameters"""
+        if (other.size_bits, other.num_hashes) != (self.size_bits, self.num_hashes):
+            raise ValueError("Cannot merge Bloom filters with different parameters")
+        merged = int.from_bytes(self._bits, 'little') | int.from_bytes(other._bits, 'little')
+        self._bits = bytearray(merged.to_bytes(len(self._bits), 'little'))
+        # Both filters may hold the same seeds, so estimate the union from the bits set
+        set_bits = bin(merged).count("1")
+        if set_bits < self.size_bits:
+            self.count = round(-self.size_bits / self.num_hashes
+                               * math.log(1 - set_bits / self.size_bits))
+
+    def to_dict(self) -> dict:
+        return {
+            'size_bits': self.size_bits,
+            'num_hashes': self.num_hashes,
+            'count': self.count,
+            'data': base64.b64encode(bytes(self._bits)).decode('ascii')
+        }
+
+    def copy(self) -> "BloomFilter":
+        bloom = BloomFilter(size_bits=self.size_bits, num_hashes=self.num_hashes)
+        bloom.count = self.count
+        bloom._bits = bytearray(self._bits)
+        return bloom
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BloomFilter":
+        bloom = cls(size_bits=data['size_bits'], num_hashes=data['num_hashes'])
+        bloom.count = data['count']
+        bloom._bits = bytearray(base64.b64decode(data['data']))
+        return bloom
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows as seeds are added
+
+    Each full filter is followed by one with twice the capacity and half the
+    false positive rate, so the combined rate stays below twice error_rate
+    however many seeds are recorded. Merged filters add at most that much
+    per merged node.
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 1e-6):
+        """
+        Create an empty filter
+
+        Args:
+            capacity: Seeds held by the first filter
+            error_rate: False positive rate of the first filter
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.filters: List[BloomFilter] = []
+
+    @property
+    def count(self) -> int:
+        return sum(bloom.count for bloom in self.filters)
+
+    def _stage_capacity(self, index: int) -> int:
+        return self.capacity * 2 ** index
+
+    def _stage_of(self, bloom: BloomFilter) -> Optional[int]:
+        """Stage a filter was sized for, or None if it matches no stage"""
+        stage = 0
+        while True:
+            size_bits, num_hashes = BloomFilter.parameters(self._stage_capacity(stage),
+                                                           self.error_rate * 0.5 ** stage)
+            if (size_bits, num_hashes) == (bloom.size_bits, bloom.num_hashes):
+                return stage
+            if size_bits > bloom.size_bits:
+                return None
+            stage += 1
+
+    def _has_room(self, bloom: BloomFilter) -> bool:
+        stage = self._stage_of(bloom)
+        return stage is not None and bloom.count < self._stage_capacity(stage)
+
+    def add(self, seed: int):
+        """Record a seed"""
+        if not self.filters or not self._has_room(self.filters[-1]):
+            stages = [self._stage_of(bloom) for bloom in self.filters]
+            stage = max((s for s in stages if s is not None), default=-1) + 1
+            self.filters.append(BloomFilter(self._stage_capacity(stage),
+                                            self.error_rate * 0.5 ** stage))
+        self.filters[-1].add(seed)
+
+    def __contains__(self, seed: int) -> bool:
+        return any(seed in bloom for bloom in self.filters)
+
+    def update(self, other: "ScalableBloomFilter"):
+        """
+        Merge another filter with identical parameters
+
+        Each of the other filter's stages is unioned into a stage of the same
+        size while the union stays within that stage's capacity, otherwise it
+        is kept as a separate stage. Merging ledgers from many nodes therefore
+        never overfills a stage.
+        """
+        if (other.capacity, other.error_rate) != (self.capacity, self.error_rate):
+            raise ValueError("Cannot merge Bloom filters with different parameters")
+        for bloom in other.filters:
+            for index, mine in enumerate(self.filters):
+                if (mine.size_bits, mine.num_hashes) != (bloom.size_bits, bloom.num_hashes):
+                    continue
+                union = mine.copy()
+                union.update(bloom)
+                if union._bits == mine._bits:
+                    # Nothing new, e.g. this ledger's own seeds read back from disk
+                    break
+                stage = self._stage_of(union)
+                if stage is not None and union.count <= self._stage_capacity(stage):
+                    self.filters[index] = union
+                    break
+            else:
+                self.filters.append(bloom.copy())
+
+    def to_dict(self) -> dict:
+        return {
+            'capacity': self.capacity,
+            'error_rate': self.error_rate,
+            'filters': [bloom.to_dict() for bloom in self.filters]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScalableBloomFilter":
+        scalable = cls(data['capacity'], data['error_rate'])
+        scalable.filters = [BloomFilter.from_dict(bloom) for bloom in data['filters']]
+        return scalable
+
+
+class CoverageLedger:
+    """Persistent record of searched seeds per version and parameter set"""
+
+    def __init__(self, path: Optional[str] = None,
+                 before_save: Optional[Callable[[], None]] = None):
+        """
+        Open a ledger
+
+        Args:
+            path: JSON file to load from and save to, or None for memory only
+            before_save: Optional callable run before each save, e.g. an
+                exporter's flush so results reach disk before their coverage
+        """
+        self.path = path
+        self.before_save = before_save
+        self._ranges: Dict[str, IntervalSet] = {}
+        self._seeds: Dict[str, ScalableBloomFilter] = {}
+
+        if path and os.path.exists(path):
+            with open(path) as f:
+                self._load(json.load(f))
+
+    def mark_range(self, key: str, start: int, end: int):
+        """Record that seeds [start, end) have been searched"""
+        self._ranges.setdefault(key, IntervalSet()).add(start, end)
+
+    def mark_seed(self, key: str, seed: int):
+        """Record that a single seed has been searched"""
+        if key not in self._seeds:
+            self._seeds[key] = ScalableBloomFilter()
+        self._seeds[key].add(seed)
+
+    def is_covered(self, key: str, seed: int) -> bool:
+        """Check whether a seed has been searched (Bloom lookups may give false positives)"""
+        if key in self._ranges and seed in self._ranges[key]:
+            return True
+        return key in self._seeds and seed in self._seeds[key]
+
+    def uncovered(self, key: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """Ranges within [start, end) still to be searched"""
+        if key not in self._ranges:
+            return [(start, end)] if start < end else []
+        return self._ranges[key].gaps(start, end)
+
+    def covered_count(self, key: str) -> int:
+        """Number of seeds covered by ranges for a key"""
+        return self._ranges[key].covered() if key in self._ranges else 0
+
+    def keys(self) -> List[str]:
+        return sorted(set(self._ranges) | set(self._seeds))
+
+    def merge(self, other: "CoverageLedger"):
+        """Merge coverage recorded by another ledger, e.g. from another node"""
+        for key, ranges in other._ranges.items():
+            self._ranges.setdefault(key, IntervalSet()).update(ranges)
+        for key, seeds in other._seeds.items():
+            if key in self._seeds:
+                self._seeds[key].update(seeds)
+            else:
+                self._seeds[key] = ScalableBloomFilter.from_dict(seeds.to_dict())
+
+    def to_dict(self) -> dict:
+        return {
+            'version': LEDGER_FORMAT_VERSION,
+            'ranges': {key: [list(r) for r in ranges] for key, ranges in self._ranges.items()},
+            'seeds': {key: seeds.to_dict() for key, seeds in self._seeds.items()}
+        }
+
+    def _load(self, data: dict):
+        version = data.get('version')
+        if version not in (1, LEDGER_FORMAT_VERSION):
+            raise ValueError(f"Unsupported ledger version: {version}")
+        for key, ranges in data.get('ranges', {}).items():
+            self._ranges[key] = IntervalSet([tuple(r) for r in ranges])
+        for key, seeds in data.get('seeds', {}).items():
+            if version == 1:
+                # Version 1 stored one fixed-size filter, the first stage of the default
+                scalable = ScalableBloomFilter()
+                scalable.filters = [BloomFilter.from_dict(seeds)]
+                seeds = scalable.to_dict()
+            self._seeds[key] = ScalableBloomFilter.from_dict(seeds)
+
+    def save(self, path: Optional[str] = None):
+        """
+        Atomically write the ledger to disk
+
+        Coverage saved to the same file by other processes since it was
+        loaded is merged in first, so concurrent searches never drop each
+        other's progress.
+        """
+        path = path or self.path
+        if not path:
+            return
+
+        # A resumed search skips covered seeds, so their results must be written first
+        if self.before_save is not None:
+            self.before_save()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with _file_lock(path):
+            if os.path.exists(path):
+                self.merge(CoverageLedger(path))
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.to_dict(), f)
+            os.replace(tmp_path, path)
+
+
+@contextlib.contextmanager
+def _file_lock(path: str):
+    """Hold an exclusive lock file next to path, portable across platforms"""
+    lock_path = path + ".lock"
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            pass
+
+        # A crashed process can leave its lock behind
+        try:
+            if time.time() - os.path.getmtime(lock_path) > STALE_LOCK_AGE:
+                os.remove(lock_path)
+                continue
+        except FileNotFoundError:
+            continue
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Timed out waiting for ledger lock: {lock_path}")
+        time.sleep(0.05)
+
+    try:
+        yield
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(lock_path)
+
+
+def merge_ledgers(output: str, paths: List[str]) -> CoverageLedger:
+    """Combine ledgers from several nodes into one file"""
+    merged = CoverageLedger()
+    for path in paths:
+        merged.merge(CoverageLedger(path))
+    merged.save(output)
+    return merged
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Inspect or merge SeedFinder coverage ledgers")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    show = subparsers.add_parser("show", help="Summarize a ledger")
+    show.add_argument("ledger")
+
+    merge = subparsers.add_parser("merge", help="Merge ledgers from several nodes")
+    merge.add_argument("output")
+    merge.add_argument("ledgers", nargs="+")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "merge":
+        ledger = merge_ledgers(args.output, args.ledgers)
+    else:
+        ledger = CoverageLedger(args.ledger)
+
+    for key in ledger.keys():
+        print(f"{key}: {ledger.covered_count(key)} seeds in ranges")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Minecraft SeedFinder - Shared-memory ring of live results
+"""
+import multiprocessing
+import os
+import struct
+from multiprocessing import shared_memory
+from typing import Iterable, List, Optional
+from exporters import BINARY_RECORD, pack_record_into, unpack_record
+
+
+# Header: capacity, records written, records read, records dropped
+_U64 = struct.Struct("<Q")
+_CAPACITY, _WRITTEN, _READ, _DROPPED = 0, 8, 16, 24
+_HEADER_SIZE = 32
+
+
+class ResultRing:
+    """
+    Bounded ring of fixed-width result records in shared memory
+
+    Any number of processes can push records, one consumer (the GUI) polls
+    them. Records are packed straight into the shared buffer, so nothing is
+    pickled on the way. When the consumer falls behind and the ring is full,
+    new records are dropped and counted instead of blocking the search.
+    """
+
+    def __init__(self, capacity: int = 4096, name: Optional[str] = None, lock=None):
+        """
+        Create a new ring, or attach to an existing one by name
+
+        Args:
+            capacity: Number of records the ring holds (ignored when attaching)
+            name: Shared memory block to attach to, None creates a new one
+            lock: Lock shared by all users, created along with a new ring
+        """
+        if name is None:
+            self._shm = shared_memory.SharedMemory(
+                create=True, size=_HEADER_SIZE + capacity * BINARY_RECORD.size
+            )
+            self._owner_pid = os.getpid()
+            self._lock = lock or multiprocessing.Lock()
+            _U64.pack_into(self._shm.buf, _CAPACITY, capacity)
+            for offset in (_WRITTEN, _READ, _DROPPED):
+                _U64.pack_into(self._shm.buf, offset, 0)
+        else:
+            self._shm = _attach(name)
+            self._owner_pid = None
+            self._lock = lock
+
+        self.capacity = _U64.unpack_from(self._shm.buf, _CAPACITY)[0]
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __getstate__(self):
+        return {'name': self._shm.name, 'lock': self._lock}
+
+    def __setstate__(self, state):
+        self.__init__(name=state['name'], lock=state['lock'])
+
+    def push(self, result: dict) -> bool:
+        """
+        Append a result record
+
+        Returns:
+            False if the ring was full and the record was dropped
+        """
+        buf = self._shm.buf
+        with self._lock:
+            written = _U64.unpack_from(buf, _WRITTEN)[0]
+            read = _U64.unpack_from(buf, _READ)[0]
+
+            if written - read >= self.capacity:
+                dropped = _U64.unpack_from(buf, _DROPPED)[0]
+                _U64.pack_into(buf, _DROPPED, dropped + 1)
+                return False
+
+            slot = written % self.capacity
+            pack_record_into(buf, _HEADER_SIZE + slot * BINARY_RECORD.size, result)
+            _U64.pack_into(buf, _WRITTEN, written + 1)
+        return True
+
+    def push_many(self, results: Iterable[dict]):
+        """Append several result records"""
+        for result in results:
+            self.push(result)
+
+    def poll(self, max_records: Optional[int] = None) -> List[dict]:
+        """
+        Take records that arrived since the previous poll
+
+        Args:
+            max_records: Upper bound on records returned
+
+        Returns:
+            List of result dictionaries in arrival order
+        """
+        buf = self._shm.buf
+        with self._lock:
+            written = _U64.unpack_from(buf, _WRITTEN)[0]
+            read = _U64.unpack_from(buf, _READ)[0]
+            count = written - read
+            if max_records is not None:
+                count = min(count, max_records)
+
+            records = [
+                BINARY_RECORD.unpack_from(
+                    buf, _HEADER_SIZE + ((read + i) % self.capacity) * BINARY_RECORD.size
+                )
+                for i in range(count)
+            ]
+            _U64.pack_into(buf, _READ, read + count)
+
+        return [unpack_record(*fields) for fields in records]
+
+    @property
+    def written(self) -> int:
+        """Total records pushed so far"""
+        return _U64.unpack_from(self._shm.buf, _WRITTEN)[0]
+
+    @property
+    def dropped(self) -> int:
+        """Total records dropped because the ring was full"""
+        return _U64.unpack_from(self._shm.buf, _DROPPED)[0]
+
+    def close(self):
+        """Detach from the ring, removing it if this process created it"""
+        if self._shm is None:
+            return
+        self._shm.close()
+        # Forked children inherit the creator's instance but must not remove it
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
+        self._shm = None
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block without letting this process's tracker remove it"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers the block, which is harmless for
+        # workers started by multiprocessing since they share the creator's
+        # resource tracker and registration is idempotent
+        return shared_memory.SharedMemory(name=name)
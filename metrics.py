@@ -0,0 +1,261 @@
+"""
+Minecraft SeedFinder - Prometheus-style metrics for long-running searches
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+
+DEFAULT_METRICS_PORT = 9464
+
+# Latency histogram bucket bounds in seconds
+LATENCY_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0, 10.0)
+
+STAGES = ('candidates', 'viability', 'constraints', 'scoring', 'seed', 'chunk')
+
+
+class SearchMetrics:
+    """Counters and latency histograms updated by the search loops"""
+
+    def __init__(self, score_cache=None):
+        """
+        Create an empty metrics registry
+
+        Args:
+            score_cache: Optional ScoreCache whose hit rate is reported
+        """
+        self.score_cache = score_cache
+        self.seeds_scanned = 0
+        self.seeds_skipped = 0
+        self.results = 0
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._reset_stages()
+        # Score cache lookups made in worker processes, and the local counts
+        # already handed out by snapshot()
+        self._worker_cache = [0, 0]
+        self._snapshot_cache = (0, 0)
+        self._last_rate = (self.started, 0)
+        self._seeds_per_second = 0.0
+
+    def _reset_stages(self):
+        self._runs: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self._calls: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self._seconds: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self._buckets: Dict[str, List[int]] = {
+            stage: [0] * len(LATENCY_BUCKETS) for stage in STAGES
+        }
+
+    def record_stage(self, stage: str, seconds: float, calls: int = 1):
+        """
+        Record one run of a search stage
+
+        Args:
+            stage: Stage name (candidates, viability, constraints, scoring, seed or chunk)
+            seconds: Time spent in the stage
+            calls: Work items processed, cubiomes calls for the position
+                stages, villages scored for scoring, seeds for seed and chunk
+        """
+        with self._lock:
+            self._record_stage(stage, seconds, calls)
+
+    def record_seed(self, seconds: float, result_count: int):
+        """Record a fully searched seed"""
+        with self._lock:
+            self._record_stage('seed', seconds, 1)
+            self.seeds_scanned += 1
+            self.results += result_count
+
+    def _record_stage(self, stage: str, seconds: float, calls: int):
+        self._runs[stage] += 1
+        self._calls[stage] += calls
+        self._seconds[stage] += seconds
+        buckets = self._buckets[stage]
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                buckets[i] += 1
+                break
+
+    def record_chunk(self, seeds: int, seconds: float, result_count: int):
+        """Record a chunk of seeds searched in a worker process"""
+        with self._lock:
+            self._record_stage('chunk', seconds, seeds)
+            self.seeds_scanned += seeds
+            self.results += result_count
+
+    def record_skipped(self, count: int):
+        """Record seeds skipped because the ledger already covers them"""
+        with self._lock:
+            self.seeds_skipped += count
+
+    def snapshot(self) -> dict:
+        """
+        Take the stage counters and score cache lookups recorded since the last snapshot
+
+        Used in worker processes to ship their measurements to the parent.
+        """
+        with self._lock:
+            data = {'runs': self._runs, 'calls': self._calls,
+                    'seconds': self._seconds, 'buckets': self._buckets}
+            self._reset_stages()
+
+        cache = self.score_cache
+        if cache is not None:
+            hits, misses = cache.hits, cache.misses
+            data['cache'] = (hits - self._snapshot_cache[0], misses - self._snapshot_cache[1])
+            self._snapshot_cache = (hits, misses)
+        return data
+
+    def merge(self, snapshot: dict):
+        """Add a snapshot taken from a worker process's metrics"""
+        with self._lock:
+            for stage in STAGES:
+                self._runs[stage] += snapshot['runs'][stage]
+                self._calls[stage] += snapshot['calls'][stage]
+                self._seconds[stage] += snapshot['seconds'][stage]
+                self._buckets[stage] = [
+                    count + other for count, other in zip(self._buckets[stage],
+                                                          snapshot['buckets'][stage])
+                ]
+            if 'cache' in snapshot:
+                self._worker_cache[0] += snapshot['cache'][0]
+                self._worker_cache[1] += snapshot['cache'][1]
+
+    def seeds_per_second(self) -> float:
+        """Throughput since the previous call at least a second ago"""
+        now = time.monotonic()
+        with self._lock:
+            last_time, last_seeds = self._last_rate
+            if now - last_time >= 1.0:
+                self._seeds_per_second = (self.seeds_scanned - last_seeds) / (now - last_time)
+                self._last_rate = (now, self.seeds_scanned)
+            return self._seeds_per_second
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        seeds_per_second = self.seeds_per_second()
+
+        with self._lock:
+            lines = [
+                "# HELP seedfinder_seeds_scanned_total Seeds fully searched.",
+                "# TYPE seedfinder_seeds_scanned_total counter",
+                f"seedfinder_seeds_scanned_total {self.seeds_scanned}",
+                "# HELP seedfinder_seeds_skipped_total Seeds skipped via the coverage ledger.",
+                "# TYPE seedfinder_seeds_skipped_total counter",
+                f"seedfinder_seeds_skipped_total {self.seeds_skipped}",
+                "# HELP seedfinder_results_total Mega-village results found.",
+                "# TYPE seedfinder_results_total counter",
+                f"seedfinder_results_total {self.results}",
+                "# HELP seedfinder_seeds_per_second Recent search throughput.",
+                "# TYPE seedfinder_seeds_per_second gauge",
+                f"seedfinder_seeds_per_second {seeds_per_second:.3f}",
+                "# HELP seedfinder_uptime_seconds Time since metrics collection started.",
+                "# TYPE seedfinder_uptime_seconds gauge",
+                f"seedfinder_uptime_seconds {time.monotonic() - self.started:.3f}",
+                "# HELP seedfinder_stage_calls_total Work items per stage: cubiomes calls for "
+                "candidates, viability and constraints, villages for scoring, seeds for seed "
+                "and chunk.",
+                "# TYPE seedfinder_stage_calls_total counter",
+            ]
+            lines += [f'seedfinder_stage_calls_total{{stage="{stage}"}} {self._calls[stage]}'
+                      for stage in STAGES]
+            worker_hits, worker_misses = self._worker_cache
+
+            lines += [
+                "# HELP seedfinder_stage_latency_seconds Time spent per stage run.",
+                "# TYPE seedfinder_stage_latency_seconds histogram",
+            ]
+            for stage in STAGES:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, self._buckets[stage]):
+                    cumulative += count
+                    lines.append(f'seedfinder_stage_latency_seconds_bucket'
+                                 f'{{stage="{stage}",le="{bound}"}} {cumulative}')
+                runs = self._runs[stage]
+                lines.append(f'seedfinder_stage_latency_seconds_bucket'
+                             f'{{stage="{stage}",le="+Inf"}} {runs}')
+                lines.append(f'seedfinder_stage_latency_seconds_sum{{stage="{stage}"}} '
+                             f'{self._seconds[stage]:.6f}')
+                lines.append(f'seedfinder_stage_latency_seconds_count{{stage="{stage}"}} {runs}')
+
+        cache = self.score_cache
+        if cache is not None or worker_hits or worker_misses:
+            hits = worker_hits + (cache.hits if cache is not None else 0)
+            misses = worker_misses + (cache.misses if cache is not None else 0)
+            lookups = hits + misses
+            lines += [
+                "# HELP seedfinder_score_cache_hits_total Village scores served from cache.",
+                "# TYPE seedfinder_score_cache_hits_total counter",
+                f"seedfinder_score_cache_hits_total {hits}",
+                "# HELP seedfinder_score_cache_misses_total Village scores computed.",
+                "# TYPE seedfinder_score_cache_misses_total counter",
+                f"seedfinder_score_cache_misses_total {misses}",
+                "# HELP seedfinder_score_cache_hit_ratio Fraction of score lookups served from cache.",
+                "# TYPE seedfinder_score_cache_hit_ratio gauge",
+                f"seedfinder_score_cache_hit_ratio {hits / lookups if lookups else 0.0:.4f}",
+            ]
+
+        return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves /metrics from the server's SearchMetrics"""
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+
+        body = self.server.metrics.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsServer:
+    """Local HTTP endpoint exposing SearchMetrics for scraping"""
+
+    def __init__(self, metrics: SearchMetrics, port: int = DEFAULT_METRICS_PORT,
+                 host: str = "127.0.0.1"):
+        """
+        Create a metrics server
+
+        Args:
+            metrics: Metrics registry to expose
+            port: TCP port, 0 picks a free one
+            host: Bind address, localhost by default
+        """
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MetricsServer":
+        """Start serving in a daemon thread"""
+        self._server = ThreadingHTTPServer((self.host, self.port), _MetricsHandler)
+        self._server.daemon_threads = True
+        self._server.metrics = self.metrics
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="seedfinder-metrics", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
@@ -0,0 +1,227 @@
+"""
+Minecraft SeedFinder - Pipelined stage execution with bounded queues
+"""
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+
+
+# Marks the end of the work stream on a stage queue
+_DONE = object()
+
+
+class _Stage:
+    """A pool of worker threads feeding one bounded queue into the next"""
+
+    def __init__(self, name: str, func, workers: int, inbox: queue.Queue,
+                 outbox: queue.Queue, stop: threading.Event, errors: list):
+        self.name = name
+        self.func = func
+        self.inbox = inbox
+        self.outbox = outbox
+        self.stop = stop
+        self.errors = errors
+        self._remaining = workers
+        self._lock = threading.Lock()
+        self.threads = [
+            threading.Thread(target=self._work, name=f"seedfinder-{name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+
+    def start(self):
+        for thread in self.threads:
+            thread.start()
+
+    def _work(self):
+        while not self.stop.is_set():
+            try:
+                item = self.inbox.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            if item is _DONE:
+                # The last worker of a stage closes the next stage
+                with self._lock:
+                    self._remaining -= 1
+                    last = self._remaining == 0
+                if last:
+                    _put(self.outbox, _DONE, self.stop)
+                else:
+                    _put(self.inbox, _DONE, self.stop)
+                return
+
+            try:
+                result = self.func(item)
+            except Exception as e:
+                self.errors.append(e)
+                self.stop.set()
+                return
+            _put(self.outbox, result, self.stop)
+
+
+def _put(target: queue.Queue, item, stop: threading.Event):
+    """Blocking put that gives up once the pipeline is stopping"""
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+class PipelineRunner:
+    """
+    Runs candidate generation, viability checks and scoring as separate stages
+
+    Each stage has its own thread pool and hands work on through a bounded
+    queue, so cubiomes calls that release the GIL overlap across seeds while a
+    slow stage applies backpressure instead of buffering without limit.
+    Results are reported in seed order, exactly as the sequential search does.
+    """
+
+    def __init__(self, candidate_workers: int = 1, viability_workers: int = 4,
+                 scoring_workers: int = 2, queue_size: int = 64,
+                 stop: Optional[threading.Event] = None):
+        """
+        Configure the pipeline
+
+        Args:
+            candidate_workers: Threads computing attempted structure positions
+            viability_workers: Threads checking whether villages generate
+            scoring_workers: Threads scoring villages and clusters
+            queue_size: Capacity of each queue between stages
+            stop: Optional event that cancels the search once set, seeds
+                already in the pipeline finish and are reported
+        """
+        self.candidate_workers = candidate_workers
+        self.viability_workers = viability_workers
+        self.scoring_workers = scoring_workers
+        self.queue_size = queue_size
+        self.stop = stop
+
+    def run(self, finder, mode: str, ranges: List[Tuple[int, int]],
+            min_houses: int, max_spacing: int, search_radius: int, on_done):
+        """
+        Search seed ranges through the pipeline, reporting each seed in order
+
+        Args:
+            finder: SeedFinder doing the work
+            mode: "full" or "48bit"
+            ranges: Half-open seed ranges to search
+            min_houses: Minimum house count threshold
+            max_spacing: Maximum spacing between houses
+            search_radius: Search radius in blocks
+            on_done: Called as on_done(start, end, [(seed, results), ...])
+                for each completed seed, in seed order
+        """
+        stop = threading.Event()
+        errors = []
+        seeds = queue.Queue(self.queue_size)
+        candidates = queue.Queue(self.queue_size)
+        viable = queue.Queue(self.queue_size)
+        scored = queue.Queue(self.queue_size)
+
+        # Seeds in flight are capped so the reorder buffer stays bounded too
+        in_flight = threading.Semaphore(self.queue_size * 4)
+
+        # Constraint queries order their own checks and run whole in the scoring stage
+        whole_seed = finder.query is not None
+
+        def find_candidates(item):
+            index, seed, start_time = item
+            search_seed = finder._mode_seed(seed, mode)
+            if whole_seed:
+                return index, seed, search_seed, None, start_time
+            try:
+                positions = finder._candidate_positions(search_seed, search_radius)
+            except Exception as e:
+                print(f"Error finding village positions: {e}")
+                positions = []
+            return index, seed, search_seed, positions, start_time
+
+        def check_viability(item):
+            index, seed, search_seed, positions, start_time = item
+            if whole_seed:
+                return item
+            try:
+                positions = finder._viable_positions(search_seed, positions)
+            except Exception as e:
+                print(f"Error finding village positions: {e}")
+                positions = []
+            return index, seed, search_seed, positions, start_time
+
+        def score(item):
+            index, seed, search_seed, positions, start_time = item
+            if whole_seed:
+                mega_villages = finder.find_mega_villages(search_seed, min_houses,
+                                                          max_spacing, search_radius)
+            else:
+                mega_villages = finder._score_positions(search_seed, positions,
+                                                        min_houses, max_spacing)
+            finder._annotate_results(mega_villages, search_seed, mode)
+            if finder.metrics is not None:
+                finder.metrics.record_seed(time.perf_counter() - start_time,
+                                           len(mega_villages))
+            return index, seed, mega_villages
+
+        stages = [
+            _Stage("candidates", find_candidates, self.candidate_workers,
+                   seeds, candidates, stop, errors),
+            _Stage("viability", check_viability, self.viability_workers,
+                   candidates, viable, stop, errors),
+            _Stage("scoring", score, self.scoring_workers,
+                   viable, scored, stop, errors),
+        ]
+
+        def feed():
+            index = 0
+            for range_start, range_end in ranges:
+                for seed in range(range_start, range_end):
+                    if self.stop is not None and self.stop.is_set():
+                        _put(seeds, _DONE, stop)
+                        return
+                    while not in_flight.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    _put(seeds, (index, seed, time.perf_counter()), stop)
+                    index += 1
+            _put(seeds, _DONE, stop)
+
+        feeder = threading.Thread(target=feed, name="seedfinder-feeder", daemon=True)
+        feeder.start()
+        for stage in stages:
+            stage.start()
+
+        pending = {}
+        next_index = 0
+        try:
+            while True:
+                try:
+                    item = scored.get(timeout=0.1)
+                except queue.Empty:
+                    if errors:
+                        raise errors[0]
+                    continue
+
+                if item is _DONE:
+                    break
+
+                index, seed, mega_villages = item
+                pending[index] = (seed, mega_villages)
+
+                # Release results in seed order
+                while next_index in pending:
+                    seed, mega_villages = pending.pop(next_index)
+                    on_done(seed, seed + 1, [(seed, mega_villages)] if mega_villages else [])
+                    in_flight.release()
+                    next_index += 1
+
+            if errors:
+                raise errors[0]
+        finally:
+            stop.set()
+            feeder.join()
+            for stage in stages:
+                for thread in stage.threads:
+                    thread.join()
@@ -0,0 +1,224 @@
+"""
+Minecraft SeedFinder - Multi-structure constraint queries
+"""
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from seedfinder import get_biome_id, get_structure_pos, is_viable_structure_pos
+
+
+# Region size in blocks (spacing in chunks * 16) of overworld structures, 1.18+
+STRUCTURE_REGIONS = {
+    'VILLAGE': 544,
+    'PILLAGER_OUTPOST': 512,
+    'RUINED_PORTAL': 640,
+    'DESERT_PYRAMID': 512,
+    'JUNGLE_PYRAMID': 512,
+    'SWAMP_HUT': 512,
+    'IGLOO': 512,
+    'SHIPWRECK': 384,
+    'OCEAN_RUIN': 320,
+    'MONUMENT': 512,
+    'MANSION': 1280,
+    'ANCIENT_CITY': 384,
+    'TRAIL_RUINS': 544,
+}
+
+
+class StructureConstraint:
+    """Require a structure within a distance range of each matching village"""
+
+    def __init__(self, structure: str, max_distance: int, min_distance: int = 0,
+                 region_size: Optional[int] = None):
+        """
+        Create a structure constraint
+
+        Args:
+            structure: Name of a cubiomes Structure member, e.g. "PILLAGER_OUTPOST"
+            max_distance: Maximum distance from the village in blocks
+            min_distance: Minimum distance from the village in blocks
+            region_size: Region size in blocks, required for structures
+                missing from STRUCTURE_REGIONS
+        """
+        if region_size is None:
+            if structure not in STRUCTURE_REGIONS:
+                raise ValueError(f"Unknown region size for structure: {structure}")
+            region_size = STRUCTURE_REGIONS[structure]
+        if not 0 <= min_distance <= max_distance:
+            raise ValueError("Expected 0 <= min_distance <= max_distance")
+
+        self.structure = structure
+        self.max_distance = max_distance
+        self.min_distance = min_distance
+        self.region_size = region_size
+
+    @property
+    def key(self) -> str:
+        return f"{self.structure}@{self.min_distance}-{self.max_distance}"
+
+    def cost(self) -> int:
+        """Position lookups needed around one village, used to order the checks"""
+        return (2 * self.max_distance // self.region_size + 2) ** 2
+
+    def in_range(self, village: Tuple[int, int], pos: Tuple[int, int]) -> bool:
+        distance = math.sqrt((village[0] - pos[0])**2 + (village[1] - pos[1])**2)
+        return self.min_distance <= distance <= self.max_distance
+
+
+class BiomeConstraint:
+    """Require each matching village to be in one of the given biomes"""
+
+    def __init__(self, biomes: Iterable[str]):
+        """
+        Create a biome constraint
+
+        Args:
+            biomes: Allowed biome IDs, e.g. {"minecraft:plains", "minecraft:meadow"}
+        """
+        self.biomes = frozenset(biomes)
+        if not self.biomes:
+            raise ValueError("A biome constraint needs at least one biome")
+
+    @property
+    def key(self) -> str:
+        return "biome=" + "|".join(sorted(self.biomes))
+
+
+class ConstraintQuery:
+    """
+    Mega-village search restricted by nearby structures and biomes
+
+    Checks run cheapest-first on the attempted village positions: structure
+    positions near each village, then whether those structures generate,
+    then biomes. Village viability and scoring, the expensive part of a
+    search, only run for villages that pass every constraint.
+    """
+
+    def __init__(self, structures: Iterable[StructureConstraint] = (),
+                 biomes: Iterable[BiomeConstraint] = ()):
+        """
+        Create a query
+
+        Args:
+            structures: Structures that must be near a village
+            biomes: Biome constraints on the village
+        """
+        # Cheapest position scans first, they reject the most for the least work
+        self.structures = sorted(structures, key=lambda constraint: constraint.cost())
+        self.biomes = list(biomes)
+
+    @property
+    def key(self) -> str:
+        """Stable description of the query, used to key the coverage ledger"""
+        keys = sorted(constraint.key for constraint in self.structures)
+        keys += sorted(constraint.key for constraint in self.biomes)
+        return ";".join(keys)
+
+    def evaluate(self, finder, seed: int, min_houses: int, max_spacing: int,
+                 search_radius: int) -> List[dict]:
+        """
+        Find mega-villages in a seed that satisfy the query
+
+        Args:
+            finder: SeedFinder supplying the version, scoring and metrics
+            seed: Minecraft world seed
+            min_houses: Minimum house count threshold
+            max_spacing: Maximum spacing between houses
+            search_radius: Search radius in blocks
+
+        Returns:
+            List of village dictionaries with seed and location info
+        """
+        # Lookup errors fail the search, a seed is never recorded as searched
+        # without actually being checked
+        structures = {constraint.structure: finder.context.structure(constraint.structure)
+                      for constraint in self.structures}
+
+        villages = [tuple(pos) for pos in finder._candidate_positions(seed, search_radius)]
+
+        start_time = time.perf_counter() if finder.metrics is not None else 0.0
+        calls = 0
+        nearby: Dict[str, Dict[Tuple[int, int], List[Tuple[int, int]]]] = {}
+
+        # Structure positions are cheap, filter villages on them first
+        for constraint in self.structures:
+            if not villages:
+                break
+            found, lookups = self._nearby_positions(
+                finder, seed, constraint, structures[constraint.structure], villages
+            )
+            calls += lookups
+            villages = [village for village in villages if found[village]]
+            nearby[constraint.key] = found
+
+        # Then check the surviving structures actually generate
+        viable: Dict[Tuple[str, Tuple[int, int]], bool] = {}
+        for constraint in self.structures:
+            if not villages:
+                break
+            structure = structures[constraint.structure]
+            found = nearby[constraint.key]
+            survivors = []
+            for village in villages:
+                for pos in found[village]:
+                    cache_key = (constraint.structure, pos)
+                    if cache_key not in viable:
+                        viable[cache_key] = is_viable_structure_pos(
+                            structure, finder.mc_version, seed, pos[0], pos[1],
+                            finder.context.overworld
+                        )
+                        calls += 1
+                    if viable[cache_key]:
+                        survivors.append(village)
+                        break
+            villages = survivors
+
+        # Then single-point biome lookups
+        for constraint in self.biomes:
+            if not villages:
+                break
+            calls += len(villages)
+            villages = [
+                village for village in villages
+                if get_biome_id(finder.mc_version, seed, village[0], village[1])
+                in constraint.biomes
+            ]
+
+        if finder.metrics is not None:
+            finder.metrics.record_stage('constraints', time.perf_counter() - start_time,
+                                        calls)
+
+        # Village viability only for the few that passed everything else
+        if villages:
+            villages = finder._viable_positions(seed, villages)
+
+        return finder._score_positions(seed, villages, min_houses, max_spacing)
+
+    @staticmethod
+    def _nearby_positions(finder, seed: int, constraint: StructureConstraint, structure,
+                          villages: List[Tuple[int, int]]):
+        """
+        Attempted positions of a structure in range of each village
+
+        Only regions that can hold a position in range of some village are
+        looked up, and each region at most once.
+        """
+        region = constraint.region_size
+        reach = constraint.max_distance
+        positions: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
+        found = {}
+
+        for x, z in villages:
+            in_range = []
+            for region_x in range((x - reach) // region, (x + reach) // region + 1):
+                for region_z in range((z - reach) // region, (z + reach) // region + 1):
+                    if (region_x, region_z) not in positions:
+                        positions[region_x, region_z] = get_structure_pos(
+                            structure, seed, finder.mc_version, region_x, region_z
+                        )
+                    pos = positions[region_x, region_z]
+                    if pos and constraint.in_range((x, z), pos):
+                        in_range.append(tuple(pos))
+            found[x, z] = in_range
+
+        return found, len(positions)
@@ -0,0 +1,250 @@
+"""
+Minecraft SeedFinder - Adaptive chunk scheduling with work stealing
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
+from typing import List, Optional, Tuple
+from score_cache import ScoreCache
+
+
+# Finder and live result ring reused by every chunk a worker process searches
+_worker_finder = None
+_worker_ring = None
+
+
+def _init_worker(finder_class, mc_version: str, cache_path: Optional[str], ring=None,
+                 query=None, collect_metrics: bool = False):
+    """Create the per-process finder"""
+    global _worker_finder, _worker_ring
+    cache = ScoreCache(cache_path) if cache_path else None
+    metrics = None
+    if collect_metrics:
+        # Imported here so workers without metrics skip the HTTP server modules
+        from metrics import SearchMetrics
+        metrics = SearchMetrics(cache)
+    _worker_finder = finder_class(mc_version, cache, metrics, query=query)
+    _worker_ring = ring
+
+    # Load cubiomes now so the first chunk's timing only measures searching
+    _worker_finder.context
+
+
+def _search_chunk(finder, ring, mode: str, start: int, end: int, min_houses: int,
+                  max_spacing: int, search_radius: int):
+    """Search seeds [start, end), returning hits, time taken and worker metrics"""
+    if finder is None:
+        finder, ring = _worker_finder, _worker_ring
+    start_time = time.perf_counter()
+    hits = []
+
+    for seed in range(start, end):
+        mega_villages = finder._search_seed(seed, mode, min_houses, max_spacing, search_radius)
+        if mega_villages:
+            hits.append((seed, mega_villages))
+
+            # Publish live results straight from the worker
+            if ring is not None:
+                ring.push_many(mega_villages)
+
+    elapsed = time.perf_counter() - start_time
+    stats = None
+    if finder is _worker_finder:
+        if finder.score_cache is not None:
+            finder.score_cache.flush()
+        # Stage timings live in this process, hand them to the parent
+        if finder.metrics is not None:
+            stats = finder.metrics.snapshot()
+
+    return hits, elapsed, stats
+
+
+class _Worker:
+    """Scheduler-side state of one worker: its own ranges and measured cost"""
+
+    def __init__(self, ranges: List[Tuple[int, int]]):
+        self.ranges = deque(ranges)
+        self.seconds_per_seed: Optional[float] = None
+
+    def remaining(self) -> int:
+        return sum(end - start for start, end in self.ranges)
+
+
+class AdaptiveScheduler:
+    """
+    Searches seed ranges in parallel with self-sizing chunks
+
+    Each worker starts with an equal share of the seeds and takes chunks from
+    the front of it. Chunk sizes follow the measured cost per seed so every
+    chunk takes roughly target_latency seconds. A worker that runs out of
+    seeds steals the back half of the largest remaining share.
+    """
+
+    def __init__(self, workers: Optional[int] = None, target_latency: float = 0.5,
+                 initial_chunk: int = 8, min_chunk: int = 1, max_chunk: int = 65536,
+                 use_processes: bool = True, ring=None,
+                 stop: Optional[threading.Event] = None, mp_context=None):
+        """
+        Configure the scheduler
+
+        Args:
+            workers: Number of workers, defaults to the CPU count
+            target_latency: Desired seconds per chunk
+            initial_chunk: Chunk size used before any cost is measured
+            min_chunk: Smallest chunk handed out
+            max_chunk: Largest chunk handed out
+            use_processes: Use worker processes, or threads sharing the finder
+            ring: Optional ResultRing workers publish results to as they find them
+            stop: Optional event that cancels the search once set, chunks
+                already running finish and are reported
+            mp_context: Optional multiprocessing context for worker processes
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.target_latency = target_latency
+        self.initial_chunk = initial_chunk
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self.use_processes = use_processes
+        self.ring = ring
+        self.stop = stop
+        self.mp_context = mp_context
+        self.steals = 0
+
+    def partition(self, ranges: List[Tuple[int, int]]) -> List[_Worker]:
+        """Split ranges into one contiguous, equally sized share per worker"""
+        total = sum(end - start for start, end in ranges)
+        share = -(-total // self.workers) if total else 0
+        shares = [[] for _ in range(self.workers)]
+
+        index, filled = 0, 0
+        for start, end in ranges:
+            while start < end:
+                take = min(end - start, share - filled)
+                shares[index].append((start, start + take))
+                start += take
+                filled += take
+                if filled == share and index < self.workers - 1:
+                    index, filled = index + 1, 0
+
+        return [_Worker(share_ranges) for share_ranges in shares]
+
+    def chunk_size(self, worker: _Worker) -> int:
+        """Chunk size expected to take target_latency seconds for a worker"""
+        if not worker.seconds_per_seed:
+            return self.initial_chunk
+        size = int(self.target_latency / worker.seconds_per_seed)
+        return max(self.min_chunk, min(self.max_chunk, size))
+
+    def next_chunk(self, worker: _Worker, workers: List[_Worker]) -> Optional[Tuple[int, int]]:
+        """Take the next chunk for a worker, stealing if its own share is empty"""
+        if not worker.ranges and not self._steal(worker, workers):
+            return None
+
+        start, end = worker.ranges[0]
+        chunk_end = min(end, start + self.chunk_size(worker))
+        if chunk_end == end:
+            worker.ranges.popleft()
+        else:
+            worker.ranges[0] = (chunk_end, end)
+        return start, chunk_end
+
+    def _steal(self, thief: _Worker, workers: List[_Worker]) -> bool:
+        """Move the back half of the largest remaining share to thief"""
+        victim = max(workers, key=lambda worker: worker.remaining())
+        remaining = victim.remaining()
+        if remaining == 0:
+            return False
+
+        # Take whole ranges from the back, then split one to reach half
+        wanted = max(1, remaining // 2)
+        stolen = deque()
+        while wanted > 0:
+            start, end = victim.ranges.pop()
+            if end - start <= wanted:
+                stolen.appendleft((start, end))
+                wanted -= end - start
+            else:
+                victim.ranges.append((start, end - wanted))
+                stolen.appendleft((end - wanted, end))
+                wanted = 0
+
+        thief.ranges = stolen
+        if thief.seconds_per_seed is None:
+            thief.seconds_per_seed = victim.seconds_per_seed
+        self.steals += 1
+        return True
+
+    def run(self, finder, mode: str, ranges: List[Tuple[int, int]],
+            min_houses: int, max_spacing: int, search_radius: int, on_done):
+        """
+        Search seed ranges in parallel
+
+        Args:
+            finder: SeedFinder doing the work (copied into worker processes)
+            mode: "full" or "48bit"
+            ranges: Half-open seed ranges to search
+            min_houses: Minimum house count threshold
+            max_spacing: Maximum spacing between houses
+            search_radius: Search radius in blocks
+            on_done: Called as on_done(start, end, [(seed, results), ...])
+                for each completed chunk, in completion order
+        """
+        workers = self.partition(ranges)
+        args = (min_houses, max_spacing, search_radius)
+
+        if self.use_processes:
+            cache_path = finder.score_cache.path if finder.score_cache is not None else None
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=self.mp_context,
+                initializer=_init_worker,
+                initargs=(type(finder), finder.mc_version, cache_path, self.ring,
+                          finder.query, finder.metrics is not None)
+            )
+            local_finder, local_ring = None, None
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.workers)
+            local_finder, local_ring = finder, self.ring
+
+        futures = {}
+
+        def submit(worker: _Worker):
+            if self.stop is not None and self.stop.is_set():
+                return
+            chunk = self.next_chunk(worker, workers)
+            if chunk:
+                start, end = chunk
+                future = executor.submit(_search_chunk, local_finder, local_ring,
+                                         mode, start, end, *args)
+                futures[future] = (worker, start, end)
+
+        try:
+            for worker in workers:
+                submit(worker)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    worker, start, end = futures.pop(future)
+                    hits, elapsed, stats = future.result()
+
+                    # Smooth the measured cost so one odd chunk does not swing sizes
+                    cost = elapsed / (end - start)
+                    if worker.seconds_per_seed is None:
+                        worker.seconds_per_seed = cost
+                    else:
+                        worker.seconds_per_seed = 0.5 * worker.seconds_per_seed + 0.5 * cost
+
+                    if self.use_processes and finder.metrics is not None:
+                        finder.metrics.record_chunk(end - start, elapsed,
+                                                    sum(len(villages) for _, villages in hits))
+                        if stats is not None:
+                            finder.metrics.merge(stats)
+
+                    on_done(start, end, hits)
+                    submit(worker)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
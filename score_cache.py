@@ -0,0 +1,129 @@
+"""
+Minecraft SeedFinder - Persistent village score cache
+"""
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+# Bump whenever the scoring model changes so stale scores are not reused
+SCORE_MODEL_VERSION = 1
+
+
+def default_cache_path() -> str:
+    """Default location of the score cache in the user's home directory"""
+    return os.path.join(os.path.expanduser("~"), ".seedfinder", "scores.db")
+
+
+class ScoreCache:
+    """Cache of village scores keyed by (version, seed, x, z)"""
+
+    def __init__(self, path: Optional[str] = None, commit_interval: int = 1000,
+                 memory_limit: int = 100000):
+        """
+        Open a score cache
+
+        Args:
+            path: SQLite database path, or None for an in-memory cache
+            commit_interval: Number of new scores buffered before committing
+            memory_limit: Scores kept in memory in front of the database
+        """
+        self.path = path
+        self.commit_interval = commit_interval
+        self.memory_limit = memory_limit
+        self.hits = 0
+        self.misses = 0
+        self._memory: Dict[Tuple[str, int, int, int], Tuple[int, str]] = {}
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._db = None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                "model INTEGER, version TEXT, seed INTEGER, x INTEGER, z INTEGER, "
+                "house_count INTEGER, biome TEXT, "
+                "PRIMARY KEY (model, version, seed, x, z)) WITHOUT ROWID"
+            )
+            self._db.commit()
+
+    def get(self, mc_version: str, seed: int, x: int, z: int) -> Optional[Tuple[int, str]]:
+        """
+        Look up a cached score
+
+        Returns:
+            (house_count, biome) or None if the village has not been scored
+        """
+        key = (mc_version, seed, x, z)
+
+        with self._lock:
+            score = self._memory.get(key)
+
+            if score is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT house_count, biome FROM scores "
+                    "WHERE model = ? AND version = ? AND seed = ? AND x = ? AND z = ?",
+                    (SCORE_MODEL_VERSION,) + key
+                ).fetchone()
+                if row:
+                    score = (row[0], row[1])
+                    if len(self._memory) >= self.memory_limit:
+                        self._commit()
+                        self._memory.clear()
+                    self._memory[key] = score
+
+            if score is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return score
+
+    def put(self, mc_version: str, seed: int, x: int, z: int, house_count: int, biome: str):
+        """Store a score, committing to disk in batches"""
+        key = (mc_version, seed, x, z)
+
+        with self._lock:
+            self._memory[key] = (house_count, biome)
+            if self._db is not None:
+                self._pending.append((SCORE_MODEL_VERSION,) + key + (house_count, biome))
+                if len(self._pending) >= self.commit_interval:
+                    self._commit()
+                if len(self._memory) > self.memory_limit:
+                    self._commit()
+                    self._memory.clear()
+
+    def flush(self):
+        """Commit buffered scores to disk"""
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        """Commit buffered scores and close the database"""
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._db is None:
+                return len(self._memory)
+            self._commit()
+            return self._db.execute(
+                "SELECT COUNT(*) FROM scores WHERE model = ?", (SCORE_MODEL_VERSION,)
+            ).fetchone()[0]
+
+    def _commit(self):
+        if self._db is not None and self._pending:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._pending
+            )
+            self._db.commit()
+            self._pending = []
@@ -1,22 +1,110 @@
 """
 Minecraft SeedFinder - Core seedfinding logic
 """
-import numpy as np
+import functools
+import hashlib
+import math
+import threading
+import time
 from typing import List, Tuple, Optional
-from cubiomes import get_structure_pos, is_viable_structure_pos, get_biome_id, Dimension, Structure
+from ledger import ledger_key
+
+
+# Structure generation only depends on the lower 48 bits of a seed
+SEED_MASK_48 = (1 << 48) - 1
+
+# Seconds between coverage ledger saves during a search
+LEDGER_SAVE_INTERVAL = 30.0
+
+
+# Different biomes have different house density potential
+# Plains and Meadows are best for large villages
+BIOME_FACTORS = {
+    "minecraft:plains": 1.2,
+    "minecraft:meadow": 1.3,
+    "minecraft:desert": 1.0,
+    "minecraft:savanna": 0.9,
+    "minecraft:taiga": 0.8,
+    "minecraft:snowy_plains": 0.8
+}
+
+
+def village_roll(mc_version: str, seed: int, x: int, z: int) -> int:
+    """
+    Deterministic pseudo-random value for a village
+    
+    Stable across runs and processes, unlike np.random or hash().
+    """
+    key = f"{mc_version}:{seed}:{x}:{z}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+
+# The cubiomes bindings are imported on first use, so importing this module
+# (e.g. in a freshly spawned worker or to read exported results) stays cheap
+@functools.lru_cache(maxsize=None)
+def _cubiomes():
+    import cubiomes
+    return cubiomes
+
+
+def get_structure_pos(structure, seed: int, mc_version: str, region_x: int, region_z: int):
+    return _cubiomes().get_structure_pos(structure, seed, mc_version, region_x, region_z)
+
+
+def is_viable_structure_pos(structure, mc_version: str, seed: int, x: int, z: int,
+                            dimension) -> bool:
+    return _cubiomes().is_viable_structure_pos(structure, mc_version, seed, x, z, dimension)
+
+
+def get_biome_id(mc_version: str, seed: int, x: int, z: int) -> str:
+    return _cubiomes().get_biome_id(mc_version, seed, x, z)
+
+
+class VersionContext:
+    """Generator setup for one Minecraft version, shared by every finder in a process"""
+    
+    def __init__(self, mc_version: str):
+        bindings = _cubiomes()
+        self.mc_version = mc_version
+        self.village = bindings.Structure.VILLAGE
+        self.overworld = bindings.Dimension.OVERWORLD
+        # Village spacing is 34 chunks
+        self.village_region = 544
+    
+    def structure(self, name: str):
+        """cubiomes Structure member by name, such as PILLAGER_OUTPOST"""
+        try:
+            return getattr(_cubiomes().Structure, name)
+        except AttributeError:
+            raise ValueError(f"Unknown structure: {name}") from None
+
+
+@functools.lru_cache(maxsize=None)
+def version_context(mc_version: str) -> VersionContext:
+    """Per-process VersionContext for a version, created on first use"""
+    return VersionContext(mc_version)
 
 
 class SeedFinder:
     """Core seedfinding logic for mega-villages"""
     
-    def __init__(self, mc_version: str):
+    def __init__(self, mc_version: str, score_cache=None, metrics=None, query=None):
         """
         Initialize seed finder
         
         Args:
             mc_version: Minecraft version (e.g., "1.20.1")
+            score_cache: Optional ScoreCache shared between searches
+            metrics: Optional SearchMetrics updated while searching
+            query: Optional ConstraintQuery mega-villages must also satisfy
         """
         self.mc_version = mc_version
+        self.score_cache = score_cache
+        self.metrics = metrics
+        self.query = query
+        if metrics is not None and score_cache is not None:
+            metrics.score_cache = score_cache
+        self._context: Optional[VersionContext] = None
         self.village_biomes = [
             "minecraft:plains",
             "minecraft:desert",
@@ -26,6 +114,13 @@ class SeedFinder:
             "minecraft:meadow"
         ]
         
+    @property
+    def context(self) -> VersionContext:
+        """Version-specific generator setup, resolved on first search"""
+        if self._context is None:
+            self._context = version_context(self.mc_version)
+        return self._context
+    
     def find_village_positions(self, seed: int, search_radius: int = 5000) -> List[Tuple[int, int]]:
         """
         Find all village positions for a given seed
@@ -40,35 +135,67 @@ class SeedFinder:
         positions = []
         
         try:
-            # Use cubiomes to find village positions
-            # Structure spacing for villages is 34 chunks, separation is 8 chunks
-            for region_x in range(-search_radius // 544, search_radius // 544 + 1):
-                for region_z in range(-search_radius // 544, search_radius // 544 + 1):
-                    pos = get_structure_pos(
-                        Structure.VILLAGE,
-                        seed,
-                        self.mc_version,
-                        region_x,
-                        region_z
-                    )
-                    
-                    if pos and self._is_within_radius(pos[0], pos[1], search_radius):
-                        # Check if village actually generates at this position
-                        if is_viable_structure_pos(
-                            Structure.VILLAGE,
-                            self.mc_version,
-                            seed,
-                            pos[0],
-                            pos[1],
-                            Dimension.OVERWORLD
-                        ):
-                            positions.append(pos)
-                            
+            candidates = self._candidate_positions(seed, search_radius)
+            positions = self._viable_positions(seed, candidates)
+            
         except Exception as e:
             print(f"Error finding village positions: {e}")
             
         return positions
     
+    def _candidate_positions(self, seed: int, search_radius: int) -> List[Tuple[int, int]]:
+        """Attempted village positions within the search radius, not yet checked"""
+        start_time = time.perf_counter() if self.metrics is not None else 0.0
+        candidates = []
+        context = self.context
+        
+        # Use cubiomes to find village positions
+        # Structure spacing for villages is 34 chunks, separation is 8 chunks
+        region = context.village_region
+        regions = range(-search_radius // region, search_radius // region + 1)
+        for region_x in regions:
+            for region_z in regions:
+                pos = get_structure_pos(
+                    context.village,
+                    seed,
+                    self.mc_version,
+                    region_x,
+                    region_z
+                )
+                
+                if pos and self._is_within_radius(pos[0], pos[1], search_radius):
+                    candidates.append(pos)
+        
+        if self.metrics is not None:
+            self.metrics.record_stage('candidates', time.perf_counter() - start_time,
+                                      len(regions) ** 2)
+        
+        return candidates
+    
+    def _viable_positions(self, seed: int,
+                          candidates: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Candidates where a village actually generates"""
+        start_time = time.perf_counter() if self.metrics is not None else 0.0
+        context = self.context
+        
+        positions = [
+            pos for pos in candidates
+            if is_viable_structure_pos(
+                context.village,
+                self.mc_version,
+                seed,
+                pos[0],
+                pos[1],
+                context.overworld
+            )
+        ]
+        
+        if self.metrics is not None:
+            self.metrics.record_stage('viability', time.perf_counter() - start_time,
+                                      len(candidates))
+        
+        return positions
+    
     def _is_within_radius(self, x: int, z: int, radius: int) -> bool:
         """Check if position is within search radius"""
         return abs(x) <= radius and abs(z) <= radius
@@ -85,39 +212,87 @@ class SeedFinder:
         Returns:
             Estimated house count
         """
+        return self.score_village(seed, x, z)[0]
+    
+    def score_village(self, seed: int, x: int, z: int) -> Tuple[int, str]:
+        """
+        Score a village, a pure function of (version, seed, x, z)
+        
+        Args:
+            seed: Minecraft world seed
+            x: Village X coordinate
+            z: Village Z coordinate
+            
+        Returns:
+            (estimated house count, biome) tuple
+        """
+        try:
+            return self._score_village(seed, x, z)
+        except Exception as e:
+            print(f"Error estimating village size: {e}")
+            return 10, "unknown"  # Conservative estimate, not cached
+    
+    def _score_village(self, seed: int, x: int, z: int) -> Tuple[int, str]:
+        """Score a village, raising if the biome lookup fails"""
+        if self.score_cache is not None:
+            score = self.score_cache.get(self.mc_version, seed, x, z)
+            if score is not None:
+                return score
+        
         # This is a simplified estimation based on terrain analysis
         # In a full implementation, this would:
         # 1. Analyze the heightmap in the village area
         # 2. Calculate the flat area available
         # 3. Estimate house capacity based on grid system
         
-        # For now, we'll use a probabilistic approach
+        # For now, we'll use a probabilistic approach seeded by the village
         # Check biome suitability first
-        try:
-            biome_id = get_biome_id(self.mc_version, seed, x, z)
-            
-            # Different biomes have different house density potential
-            # Plains and Meadows are best for large villages
-            biome_factors = {
-                "minecraft:plains": 1.2,
-                "minecraft:meadow": 1.3,
-                "minecraft:desert": 1.0,
-                "minecraft:savanna": 0.9,
-                "minecraft:taiga": 0.8,
-                "minecraft:snowy_plains": 0.8
-            }
-            
-            base_houses = 8  # Minimum houses in a village
-            max_additional = np.random.randint(40, 120)  # Random additional houses
-            
-            # Apply biome factor
-            factor = biome_factors.get(biome_id, 1.0)
-            
-            return int(base_houses + max_additional * factor)
+        biome_id = get_biome_id(self.mc_version, seed, x, z)
+        
+        base_houses = 8  # Minimum houses in a village
+        max_additional = 40 + village_roll(self.mc_version, seed, x, z) % 80  # 40-119
+        
+        # Apply biome factor
+        factor = BIOME_FACTORS.get(biome_id, 1.0)
+        house_count = int(base_houses + max_additional * factor)
+        
+        if self.score_cache is not None:
+            self.score_cache.put(self.mc_version, seed, x, z, house_count, biome_id)
+        
+        return house_count, biome_id
+    
+    def evaluate_village(self, seed: int, x: int, z: int) -> Optional[dict]:
+        """
+        Re-evaluate a single recorded village position
+        
+        Args:
+            seed: Minecraft world seed
+            x: Village X coordinate
+            z: Village Z coordinate
             
-        except Exception as e:
-            print(f"Error estimating village size: {e}")
-            return 10  # Conservative estimate
+        Returns:
+            Village dictionary, or None if no village generates there
+        """
+        context = self.context
+        if not is_viable_structure_pos(
+            context.village,
+            self.mc_version,
+            seed,
+            x,
+            z,
+            context.overworld
+        ):
+            return None
+        
+        house_count, biome = self._score_village(seed, x, z)
+        
+        return {
+            'seed': seed,
+            'x': x,
+            'z': z,
+            'house_count': house_count,
+            'biome': biome
+        }
     
     def check_spacing(self, village_positions: List[Tuple[int, int]], max_spacing: int = 25) -> bool:
         """
@@ -140,7 +315,7 @@ class SeedFinder:
         
         for i, pos1 in enumerate(village_positions):
             for j, pos2 in enumerate(village_positions[i+1:], i+1):
-                distance = np.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
+                distance = math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
                 
                 # If villages are close (< 300 blocks), they could potentially merge
                 if distance < 300:
@@ -162,34 +337,48 @@ class SeedFinder:
         Returns:
             List of village dictionaries with seed and location info
         """
+        if self.query is not None:
+            return self.query.evaluate(self, seed, min_houses, max_spacing, search_radius)
+        
+        # Find all village positions, errors fail the search rather than
+        # passing the seed off as searched with no results
+        candidates = self._candidate_positions(seed, search_radius)
+        village_positions = self._viable_positions(seed, candidates)
+        
+        return self._score_positions(seed, village_positions, min_houses, max_spacing)
+    
+    def _score_positions(self, seed: int, village_positions: List[Tuple[int, int]],
+                         min_houses: int, max_spacing: int) -> List[dict]:
+        """Turn viable village positions into mega-village results"""
         mega_villages = []
         
-        # Find all village positions
-        village_positions = self.find_village_positions(seed, search_radius)
+        # Score each village once, the cluster pass reuses the same scores
+        start_time = time.perf_counter() if self.metrics is not None else 0.0
+        scores = [self._score_village(seed, x, z) for x, z in village_positions]
+        if self.metrics is not None:
+            self.metrics.record_stage('scoring', time.perf_counter() - start_time,
+                                      len(village_positions))
         
         # Check each village
-        for x, z in village_positions:
-            house_count = self.estimate_village_size(seed, x, z)
-            
+        for (x, z), (house_count, biome) in zip(village_positions, scores):
             if house_count >= min_houses:
                 mega_villages.append({
                     'seed': seed,
                     'x': x,
                     'z': z,
                     'house_count': house_count,
-                    'biome': self._get_village_biome(seed, x, z)
+                    'biome': biome
                 })
         
         # Also check for village clusters (adjacent villages)
         if self.check_spacing(village_positions, max_spacing):
             # Calculate combined house count for clustered villages
-            combined_houses = sum([self.estimate_village_size(seed, x, z) 
-                                   for x, z in village_positions])
+            combined_houses = sum(house_count for house_count, _ in scores)
             
             if combined_houses >= min_houses:
                 # Find center of cluster
-                avg_x = int(np.mean([x for x, z in village_positions]))
-                avg_z = int(np.mean([z for x, z in village_positions]))
+                avg_x = int(sum(x for x, z in village_positions) / len(village_positions))
+                avg_z = int(sum(z for x, z in village_positions) / len(village_positions))
                 
                 mega_villages.append({
                     'seed': seed,
@@ -211,7 +400,8 @@ class SeedFinder:
     
     def search_seeds(self, start_seed: int, end_seed: int, min_houses: int = 100,
                      max_spacing: int = 25, search_radius: int = 5000,
-                     progress_callback=None) -> List[dict]:
+                     progress_callback=None, result_callback=None,
+                     ledger=None, runner=None) -> List[dict]:
         """
         Search for mega-villages in a range of seeds
         
@@ -222,37 +412,212 @@ class SeedFinder:
             max_spacing: Maximum spacing between houses
             search_radius: Search radius in blocks
             progress_callback: Optional callback function for progress updates
+            result_callback: Optional callback receiving each seed's new results
+            ledger: Optional CoverageLedger, already covered seeds are skipped
+            runner: Optional execution strategy, e.g. PipelineRunner
+            
+        Returns:
+            List of mega-village dictionaries
+        """
+        return self._search_range("full", start_seed, end_seed,
+                                  min_houses, max_spacing, search_radius,
+                                  progress_callback, result_callback, ledger, runner)
+    
+    def search_seed_list(self, seeds: List[int], min_houses: int = 100,
+                         max_spacing: int = 25, search_radius: int = 5000,
+                         progress_callback=None, result_callback=None,
+                         ledger=None) -> List[dict]:
+        """
+        Search for mega-villages in an arbitrary list of seeds
+        
+        Args:
+            seeds: Seeds to search, e.g. candidates from a seed cracker
+            min_houses: Minimum house count threshold
+            max_spacing: Maximum spacing between houses
+            search_radius: Search radius in blocks
+            progress_callback: Optional callback function for progress updates
+            result_callback: Optional callback receiving each seed's new results
+            ledger: Optional CoverageLedger, already covered seeds are skipped
             
         Returns:
             List of mega-village dictionaries
         """
         results = []
+        key = self._ledger_key("full", min_houses, max_spacing, search_radius)
+        last_save = time.monotonic()
+        
+        # A missing cubiomes fails here, before any seed is recorded as searched
+        self.context
+        
+        try:
+            for i, seed in enumerate(seeds):
+                if ledger is not None and ledger.is_covered(key, seed):
+                    if self.metrics is not None:
+                        self.metrics.record_skipped(1)
+                else:
+                    mega_villages = self._search_seed(seed, "full", min_houses,
+                                                      max_spacing, search_radius)
+                    
+                    if mega_villages:
+                        results.extend(mega_villages)
+                        
+                        if result_callback:
+                            result_callback(mega_villages)
+                    
+                    if ledger is not None:
+                        ledger.mark_seed(key, seed)
+                        if time.monotonic() - last_save >= LEDGER_SAVE_INTERVAL:
+                            ledger.save()
+                            last_save = time.monotonic()
+                
+                # Update progress
+                if progress_callback:
+                    progress_callback(i / len(seeds) * 100, len(results))
+        finally:
+            self._finish_search(ledger)
+        
+        return results
+    
+    def _search_range(self, mode: str, start_seed: int, end_seed: int,
+                      min_houses: int, max_spacing: int, search_radius: int,
+                      progress_callback=None, result_callback=None,
+                      ledger=None, runner=None) -> List[dict]:
+        """Search a seed range with a runner, skipping seeds the ledger covers"""
+        blocks = []
+        result_count = 0
         total_seeds = end_seed - start_seed
         
-        for seed in range(start_seed, end_seed):
-            mega_villages = self.find_mega_villages(seed, min_houses, max_spacing, search_radius)
+        key = self._ledger_key(mode, min_houses, max_spacing, search_radius)
+        if ledger is not None:
+            ranges = ledger.uncovered(key, start_seed, end_seed)
+        else:
+            ranges = [(start_seed, end_seed)]
+        
+        # Seeds skipped via the ledger count as done
+        done = total_seeds - sum(end - start for start, end in ranges)
+        if self.metrics is not None and done:
+            self.metrics.record_skipped(done)
+        
+        last_save = time.monotonic()
+        
+        def on_done(block_start: int, block_end: int, hits: List[Tuple[int, List[dict]]]):
+            nonlocal done, result_count, last_save
             
-            if mega_villages:
-                results.extend(mega_villages)
+            if hits:
+                blocks.append((block_start, hits))
+            
+            for _, mega_villages in hits:
+                result_count += len(mega_villages)
+                
+                if result_callback:
+                    result_callback(mega_villages)
+            
+            # Record coverage as blocks complete and save it periodically so
+            # interrupted runs keep their progress
+            if ledger is not None:
+                ledger.mark_range(key, block_start, block_end)
+                if time.monotonic() - last_save >= LEDGER_SAVE_INTERVAL:
+                    ledger.save()
+                    last_save = time.monotonic()
             
             # Update progress
+            done += block_end - block_start
             if progress_callback:
-                progress = (seed - start_seed) / total_seeds * 100
-                progress_callback(progress, len(results))
+                progress_callback(done / total_seeds * 100, result_count)
         
-        return results
+        # A missing cubiomes fails here, before any seed is recorded as searched
+        self.context
+        
+        runner = runner or SequentialRunner()
+        try:
+            runner.run(self, mode, ranges, min_houses, max_spacing, search_radius, on_done)
+        finally:
+            self._finish_search(ledger)
+        
+        # Parallel runners may finish blocks out of order, results are always in seed order
+        blocks.sort(key=lambda block: block[0])
+        return [village for _, hits in blocks for _, mega_villages in hits
+                for village in mega_villages]
+    
+    def count_searched(self, ledger, start_seed: int, end_seed: int, min_houses: int,
+                       max_spacing: int, search_radius: int, mode: str = "full") -> int:
+        """
+        Count seeds in a range the ledger already covers for these parameters
+        
+        Args:
+            ledger: CoverageLedger to check
+            start_seed: Starting seed
+            end_seed: Ending seed
+            min_houses: Minimum house count threshold
+            max_spacing: Maximum spacing between houses
+            search_radius: Search radius in blocks
+            mode: "full" or "48bit"
+            
+        Returns:
+            Number of seeds a search of the range would skip
+        """
+        key = self._ledger_key(mode, min_houses, max_spacing, search_radius)
+        remaining = sum(end - start for start, end in ledger.uncovered(key, start_seed, end_seed))
+        return end_seed - start_seed - remaining
+    
+    def _ledger_key(self, mode: str, min_houses: int, max_spacing: int,
+                    search_radius: int) -> str:
+        """Ledger key for this finder's version, query and search parameters"""
+        key = ledger_key(mode, self.mc_version, min_houses, max_spacing, search_radius)
+        # Coverage of a constraint query says nothing about other queries
+        if self.query is not None:
+            key += f":{self.query.key}"
+        return key
+    
+    def _search_seed(self, seed: int, mode: str, min_houses: int, max_spacing: int,
+                     search_radius: int) -> List[dict]:
+        """Search a single seed in "full" or "48bit" mode"""
+        start_time = time.perf_counter() if self.metrics is not None else 0.0
+        
+        search_seed = self._mode_seed(seed, mode)
+        mega_villages = self.find_mega_villages(search_seed, min_houses,
+                                                max_spacing, search_radius)
+        self._annotate_results(mega_villages, search_seed, mode)
+        
+        if self.metrics is not None:
+            self.metrics.record_seed(time.perf_counter() - start_time, len(mega_villages))
+        
+        return mega_villages
+    
+    @staticmethod
+    def _mode_seed(seed: int, mode: str) -> int:
+        """Seed actually passed to cubiomes in the given mode"""
+        # Mask to lower 48 bits
+        return seed & SEED_MASK_48 if mode == "48bit" else seed
+    
+    @staticmethod
+    def _annotate_results(mega_villages: List[dict], search_seed: int, mode: str):
+        """Add mode-specific fields to results"""
+        if mode == "48bit":
+            # Store both full and masked seed
+            for village in mega_villages:
+                village['seed_48bit'] = search_seed
+                village['full_seed'] = None  # Would need upper 16 bits calculation
+    
+    def _finish_search(self, ledger=None):
+        """Persist caches and coverage at the end of a search"""
+        if self.score_cache is not None:
+            self.score_cache.flush()
+        if ledger is not None:
+            ledger.save()
 
 
 class FastSeedFinder(SeedFinder):
     """Optimized seed finder focusing on lower 48 bits"""
     
-    def __init__(self, mc_version: str):
-        super().__init__(mc_version)
+    def __init__(self, mc_version: str, score_cache=None, metrics=None, query=None):
+        super().__init__(mc_version, score_cache, metrics, query)
     
     def search_lower_48_bits(self, start_seed: int, end_seed: int, 
                             min_houses: int = 100, max_spacing: int = 25,
                             search_radius: int = 5000,
-                            progress_callback=None) -> List[dict]:
+                            progress_callback=None, result_callback=None,
+                            ledger=None, runner=None) -> List[dict]:
         """
         Search using only lower 48 bits for speed (65536x faster)
         
@@ -263,31 +628,65 @@ class FastSeedFinder(SeedFinder):
             max_spacing: Maximum spacing between houses
             search_radius: Search radius in blocks
             progress_callback: Optional callback function for progress updates
+            result_callback: Optional callback receiving each seed's new results
+            ledger: Optional CoverageLedger, already covered seeds are skipped
+            runner: Optional execution strategy, e.g. PipelineRunner
             
         Returns:
             List of mega-village dictionaries
         """
-        results = []
-        total_seeds = end_seed - start_seed
+        return self._search_range("48bit", start_seed, end_seed,
+                                  min_houses, max_spacing, search_radius,
+                                  progress_callback, result_callback, ledger, runner)
+    
+    def find_mega_villages_48bit(self, seed: int, min_houses: int = 100,
+                                 max_spacing: int = 25, search_radius: int = 5000) -> List[dict]:
+        """
+        Find mega-villages using only the lower 48 bits of a seed
         
-        for seed in range(start_seed, end_seed):
-            # Mask to lower 48 bits
-            masked_seed = seed & ((1 << 48) - 1)
-            
-            mega_villages = self.find_mega_villages(masked_seed, min_houses, 
-                                                    max_spacing, search_radius)
-            
-            if mega_villages:
-                # Store both full and masked seed
-                for village in mega_villages:
-                    village['seed_48bit'] = masked_seed
-                    village['full_seed'] = None  # Would need upper 16 bits calculation
-                
-                results.extend(mega_villages)
+        Args:
+            seed: Minecraft world seed
+            min_houses: Minimum house count threshold
+            max_spacing: Maximum spacing between houses
+            search_radius: Search radius in blocks
             
-            # Update progress
-            if progress_callback:
-                progress = (seed - start_seed) / total_seeds * 100
-                progress_callback(progress, len(results))
+        Returns:
+            List of village dictionaries with both full and masked seed
+        """
+        return self._search_seed(seed, "48bit", min_houses, max_spacing, search_radius)
+
+
+class SequentialRunner:
+    """Searches seeds one after another in the calling thread"""
+    
+    def __init__(self, stop: Optional[threading.Event] = None):
+        """
+        Configure the runner
         
-        return results
+        Args:
+            stop: Optional event that ends the search after the current seed once set
+        """
+        self.stop = stop
+    
+    def run(self, finder: SeedFinder, mode: str, ranges: List[Tuple[int, int]],
+            min_houses: int, max_spacing: int, search_radius: int, on_done):
+        """
+        Search seed ranges, reporting each seed in order
+        
+        Args:
+            finder: SeedFinder doing the work
+            mode: "full" or "48bit"
+            ranges: Half-open seed ranges to search
+            min_houses: Minimum house count threshold
+            max_spacing: Maximum spacing between houses
+            search_radius: Search radius in blocks
+            on_done: Called as on_done(start, end, [(seed, results), ...])
+                for each completed block of seeds
+        """
+        for range_start, range_end in ranges:
+            for seed in range(range_start, range_end):
+                if self.stop is not None and self.stop.is_set():
+                    return
+                mega_villages = finder._search_seed(seed, mode, min_houses,
+                                                    max_spacing, search_radius)
+                on_done(seed, seed + 1, [(seed, mega_villages)] if mega_villages else [])
@@ -0,0 +1,15 @@
+"""
+Deterministic stand-ins for the cubiomes lookups
+"""
+import random
+import time
+
+
+def fake_structure_pos(structure, seed, version, region_x, region_z):
+    """Deterministic attempted positions with a little jitter in timing"""
+    time.sleep(random.random() * 0.0005)
+    return ((seed * 7 + region_x * 100) % 500, (seed * 3 + region_z * 100) % 500)
+
+
+def fake_is_viable(structure, version, seed, x, z, dimension):
+    return (x + z + seed) % 3 != 0
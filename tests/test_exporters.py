@@ -0,0 +1,134 @@
+"""
+Unit tests for streaming exporters
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from exporters import (
+    get_exporter, load_results, read_binary_results, iter_binary_results,
+    JSONLExporter, CSVExporter, BinaryExporter, BINARY_HEADER, BINARY_RECORD, TAIL_CHUNK
+)
+
+
+RESULTS = [
+    {'seed': 12345, 'x': 100, 'z': -200, 'house_count': 120,
+     'biome': 'minecraft:plains'},
+    {'seed': 12345, 'x': 50, 'z': -50, 'house_count': 210,
+     'biome': 'cluster', 'is_cluster': True},
+    {'seed': 777, 'x': -10, 'z': 30, 'house_count': 101,
+     'biome': 'minecraft:desert', 'seed_48bit': 777, 'full_seed': None}
+]
+
+
+class TestExporters(unittest.TestCase):
+    """Test exporter round trips and resuming"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir, name)
+
+    def test_round_trip_all_formats(self):
+        """Test every format loads back the written results"""
+        for name in ("out.json", "out.jsonl", "out.csv", "out.sfr"):
+            with get_exporter(self.path(name), batch_size=2) as exporter:
+                exporter.write_many(RESULTS)
+
+            self.assertEqual(load_results(self.path(name)), RESULTS, name)
+
+    def test_unsupported_format(self):
+        """Test unknown extensions are rejected"""
+        with self.assertRaises(ValueError):
+            get_exporter(self.path("out.txt"))
+
+    def test_json_cannot_append(self):
+        """Test JSON array exports refuse to resume"""
+        with self.assertRaises(ValueError):
+            get_exporter(self.path("out.json"), append=True)
+
+    def test_batched_flush(self):
+        """Test results are written once a batch fills up"""
+        exporter = JSONLExporter(self.path("out.jsonl"), batch_size=2)
+        exporter.write(RESULTS[0])
+        self.assertEqual(load_results(self.path("out.jsonl")), [])
+        exporter.write(RESULTS[1])
+        self.assertEqual(len(load_results(self.path("out.jsonl"))), 2)
+        exporter.close()
+
+    def test_append_resumes_text_formats(self):
+        """Test appending drops a partial line and keeps a single CSV header"""
+        for cls, name in ((JSONLExporter, "out.jsonl"), (CSVExporter, "out.csv")):
+            with cls(self.path(name)) as exporter:
+                exporter.write_many(RESULTS[:2])
+            with open(self.path(name), 'a') as f:
+                f.write('{"seed": 9')
+
+            with cls(self.path(name), append=True) as exporter:
+                exporter.write(RESULTS[2])
+
+            self.assertEqual(load_results(self.path(name)), RESULTS, name)
+
+    def test_append_keeps_records_before_long_partial_line(self):
+        """Test a partial line longer than one read chunk only drops that line"""
+        for cls, name in ((JSONLExporter, "long.jsonl"), (CSVExporter, "long.csv")):
+            with cls(self.path(name)) as exporter:
+                exporter.write_many(RESULTS[:2])
+            with open(self.path(name), 'a') as f:
+                f.write('{"biome": "' + "x" * (TAIL_CHUNK * 2))
+
+            with cls(self.path(name), append=True) as exporter:
+                exporter.write(RESULTS[2])
+
+            self.assertEqual(load_results(self.path(name)), RESULTS, name)
+
+    def test_append_restarts_file_without_complete_line(self):
+        """Test a file holding only a partial header is started over"""
+        with open(self.path("out.csv"), 'w') as f:
+            f.write("seed,x,")
+
+        with CSVExporter(self.path("out.csv"), append=True) as exporter:
+            exporter.write(RESULTS[0])
+
+        self.assertEqual(load_results(self.path("out.csv")), RESULTS[:1])
+
+    def test_append_resumes_binary(self):
+        """Test appending drops a partial binary record"""
+        with BinaryExporter(self.path("out.sfr")) as exporter:
+            exporter.write_many(RESULTS[:2])
+        with open(self.path("out.sfr"), 'ab') as f:
+            f.write(b"\x01\x02\x03")
+
+        with BinaryExporter(self.path("out.sfr"), append=True) as exporter:
+            exporter.write(RESULTS[2])
+
+        size = os.path.getsize(self.path("out.sfr"))
+        self.assertEqual(size, BINARY_HEADER.size + 3 * BINARY_RECORD.size)
+        self.assertEqual(list(iter_binary_results(self.path("out.sfr"))), RESULTS)
+
+    def test_binary_memory_map(self):
+        """Test binary exports can be memory-mapped as a structured array"""
+        with BinaryExporter(self.path("out.sfr")) as exporter:
+            exporter.write_many(RESULTS)
+
+        records = read_binary_results(self.path("out.sfr"))
+        self.assertEqual(len(records), 3)
+        self.assertEqual(int(records['seed'][0]), 12345)
+        self.assertEqual(int(records['house_count'][1]), 210)
+        self.assertEqual(records['biome'][2], b'minecraft:desert')
+
+    def test_binary_rejects_foreign_file(self):
+        """Test binary reader rejects files without the header"""
+        with open(self.path("bad.sfr"), 'wb') as f:
+            f.write(b"not a seedfinder export")
+
+        with self.assertRaises(ValueError):
+            load_results(self.path("bad.sfr"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,9 +3,13 @@ Unit tests for GUI functionality
 """
 import unittest
 from unittest.mock import patch, MagicMock
-from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWidgets import QApplication, QMessageBox
+import os
 import sys
+import tempfile
+import time
 from main import SeedFinderGUI
+from exporters import get_exporter, load_results
 
 
 class TestSeedFinderGUI(unittest.TestCase):
@@ -67,6 +71,120 @@ class TestSeedFinderGUI(unittest.TestCase):
         self.gui.apply_theme()
         palette = self.gui.palette()
         self.assertIsNotNone(palette)
+    
+    def test_rejects_seeds_beyond_64_bits(self):
+        """Test seed ranges that do not fit a signed 64-bit seed are rejected"""
+        self.gui.start_seed_input.setText(str(2 ** 63 - 1))
+        self.gui.end_seed_input.setText(str(2 ** 63 + 5))
+        
+        self.gui.start_search()
+        
+        self.assertTrue(self.gui.status_label.text().startswith("Error: Seeds must be"))
+        self.assertIsNone(self.gui.search_thread)
+    
+    @patch('gui.QMessageBox.question')
+    @patch('gui.QFileDialog.getSaveFileName')
+    def test_stream_exporter_confirms_json_overwrite(self, mock_dialog, mock_question):
+        """Test an existing JSON stream target is only replaced after confirming"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.json")
+            with open(path, 'w') as f:
+                f.write("[]")
+            mock_dialog.return_value = (path, "")
+            mock_question.return_value = QMessageBox.No
+            
+            self.assertIsNone(self.gui.open_stream_exporter())
+            with open(path) as f:
+                self.assertEqual(f.read(), "[]")
+            
+            mock_question.return_value = QMessageBox.Yes
+            exporter = self.gui.open_stream_exporter()
+            self.assertIsNotNone(exporter)
+            exporter.close()
+    
+    @patch('gui.QFileDialog.getSaveFileName')
+    def test_export_adds_missing_extension(self, mock_dialog):
+        """Test a name typed without an extension gets the selected filter's"""
+        self.gui.results = [{'seed': 1, 'x': 0, 'z': 0, 'house_count': 120,
+                             'biome': "minecraft:plains"}]
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            mock_dialog.return_value = (os.path.join(tmp, "results"), "CSV Files (*.csv)")
+            self.gui.export_results()
+            self.assertEqual(load_results(os.path.join(tmp, "results.csv")), self.gui.results)
+            
+            mock_dialog.return_value = (os.path.join(tmp, "stream"), "")
+            exporter = self.gui.open_stream_exporter()
+            self.assertEqual(exporter.path, os.path.join(tmp, "stream.jsonl"))
+            exporter.close()
+    
+    @patch.object(SeedFinderGUI, 'commit_changes')
+    @patch('gui.default_ledger_path')
+    @patch('gui.default_cache_path')
+    @patch('seedfinder.SeedFinder.find_mega_villages')
+    def test_stop_search(self, mock_find, mock_cache_path, mock_ledger_path, mock_commit):
+        """Test Stop returns at once and the live ring is released after the thread ends"""
+        def slow_find(seed, *args):
+            time.sleep(0.001)
+            return [{'seed': seed, 'x': 0, 'z': 0, 'house_count': 120,
+                     'biome': "minecraft:plains"}]
+        mock_find.side_effect = slow_find
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            mock_cache_path.return_value = os.path.join(tmp, "scores.db")
+            mock_ledger_path.return_value = os.path.join(tmp, "ledger.json")
+            self.gui.end_seed_input.setText("1000000")
+            
+            self.gui.start_search()
+            time.sleep(0.1)
+            started = time.perf_counter()
+            self.gui.stop_search()
+            
+            # Stopping returns straight away, the thread winds down on its own
+            self.assertLess(time.perf_counter() - started, 0.05)
+            self.assertEqual(self.gui.status_label.text(), "Stopping...")
+            self.assertFalse(self.gui.stop_button.isEnabled())
+            self.assertTrue(self.gui.search_thread.wait(5000))
+            self.assertIsNotNone(self.gui.live_ring)
+            
+            QApplication.processEvents()
+            self.assertIsNone(self.gui.live_ring)
+            self.assertTrue(self.gui.status_label.text().startswith("Search stopped"))
+            self.assertTrue(self.gui.start_button.isEnabled())
+            self.assertTrue(os.path.exists(mock_ledger_path.return_value))
+            self.gui.score_cache.close()
+    
+    @patch.object(SeedFinderGUI, 'commit_changes')
+    @patch.object(SeedFinderGUI, 'open_stream_exporter')
+    @patch('gui.default_ledger_path')
+    @patch('gui.default_cache_path')
+    @patch('seedfinder.SeedFinder.find_mega_villages')
+    def test_stop_flushes_stream_exporter(self, mock_find, mock_cache_path, mock_ledger_path,
+                                          mock_open_exporter, mock_commit):
+        """Test results buffered by the stream exporter are written when stopping"""
+        mock_find.side_effect = lambda seed, *args: [
+            {'seed': seed, 'x': 0, 'z': 0, 'house_count': 120, 'biome': "minecraft:plains"}
+        ]
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            mock_cache_path.return_value = os.path.join(tmp, "scores.db")
+            mock_ledger_path.return_value = os.path.join(tmp, "ledger.json")
+            path = os.path.join(tmp, "stream.jsonl")
+            mock_open_exporter.return_value = get_exporter(path, batch_size=100000)
+            self.gui.stream_check.setChecked(True)
+            self.gui.end_seed_input.setText("100000000")
+            
+            self.gui.start_search()
+            self.assertEqual(self.gui.search_thread.ledger.before_save,
+                             mock_open_exporter.return_value.flush)
+            time.sleep(0.1)
+            self.gui.stop_search()
+            self.gui.search_thread.wait()
+            QApplication.processEvents()
+            
+            self.assertGreater(len(self.gui.results), 0)
+            self.assertEqual(load_results(path), self.gui.results)
+            self.gui.score_cache.close()
 
 
 if __name__ == '__main__':
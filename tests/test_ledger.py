@@ -0,0 +1,161 @@
+"""
+Unit tests for the coverage ledger
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from ledger import (
+    IntervalSet, BloomFilter, ScalableBloomFilter, CoverageLedger, ledger_key, merge_ledgers
+)
+
+
+class TestIntervalSet(unittest.TestCase):
+    """Test IntervalSet functionality"""
+    
+    def test_add_merges(self):
+        """Test overlapping and adjacent ranges are merged"""
+        intervals = IntervalSet([(10, 20), (30, 40)])
+        intervals.add(20, 25)
+        self.assertEqual(list(intervals), [(10, 25), (30, 40)])
+        intervals.add(0, 35)
+        self.assertEqual(list(intervals), [(0, 40)])
+        intervals.add(50, 60)
+        self.assertEqual(len(intervals), 2)
+        self.assertEqual(intervals.covered(), 50)
+    
+    def test_contains(self):
+        """Test membership uses half-open ranges"""
+        intervals = IntervalSet([(10, 20)])
+        self.assertIn(10, intervals)
+        self.assertIn(19, intervals)
+        self.assertNotIn(20, intervals)
+        self.assertNotIn(9, intervals)
+    
+    def test_gaps(self):
+        """Test uncovered ranges are reported"""
+        intervals = IntervalSet([(10, 20), (30, 40)])
+        self.assertEqual(intervals.gaps(0, 50), [(0, 10), (20, 30), (40, 50)])
+        self.assertEqual(intervals.gaps(12, 18), [])
+        self.assertEqual(intervals.gaps(15, 35), [(20, 30)])
+        self.assertEqual(IntervalSet().gaps(0, 5), [(0, 5)])
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Test BloomFilter functionality"""
+    
+    def test_membership(self):
+        """Test added seeds are found and merging keeps them"""
+        first = BloomFilter(capacity=1000)
+        second = BloomFilter(capacity=1000)
+        first.add(12345)
+        second.add(-42)
+        
+        self.assertIn(12345, first)
+        self.assertNotIn(-42, first)
+        first.update(second)
+        self.assertIn(-42, first)
+        
+        restored = BloomFilter.from_dict(first.to_dict())
+        self.assertIn(12345, restored)
+        self.assertIn(-42, restored)
+    
+    def test_merge_mismatch(self):
+        """Test filters with different parameters cannot be merged"""
+        with self.assertRaises(ValueError):
+            BloomFilter(capacity=1000).update(BloomFilter(capacity=10))
+
+    def test_scalable_beyond_capacity(self):
+        """Test marking far more seeds than the capacity keeps false positives rare"""
+        bloom = ScalableBloomFilter(capacity=1000, error_rate=1e-4)
+        for seed in range(20000):
+            bloom.add(seed)
+        
+        self.assertGreater(len(bloom.filters), 1)
+        self.assertTrue(all(seed in bloom for seed in range(20000)))
+        false_positives = sum(seed in bloom for seed in range(10**9, 10**9 + 20000))
+        self.assertLess(false_positives, 20)
+        
+        other = ScalableBloomFilter(capacity=1000, error_rate=1e-4)
+        other.add(-42)
+        other.update(ScalableBloomFilter.from_dict(bloom.to_dict()))
+        self.assertIn(-42, other)
+        self.assertIn(19999, other)
+    
+    def test_multi_node_merge(self):
+        """Test merging many nodes' filters does not overfill the first stage"""
+        merged = ScalableBloomFilter(capacity=1000, error_rate=1e-4)
+        for node in range(10):
+            bloom = ScalableBloomFilter(capacity=1000, error_rate=1e-4)
+            for seed in range(node * 1000, node * 1000 + 1000):
+                bloom.add(seed)
+            merged.update(bloom)
+            merged.update(bloom)
+        
+        self.assertTrue(all(seed in merged for seed in range(10000)))
+        self.assertTrue(all(bloom.count <= 1000 for bloom in merged.filters))
+        self.assertEqual(len(merged.filters), 10)
+        false_positives = sum(seed in merged for seed in range(10**9, 10**9 + 20000))
+        self.assertLess(false_positives, 40)
+
+
+class TestCoverageLedger(unittest.TestCase):
+    """Test CoverageLedger functionality"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.key = ledger_key("full", "1.20.4", 100, 25, 5000)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    
+    def test_keys_separate_parameters(self):
+        """Test coverage is tracked per version and parameter set"""
+        ledger = CoverageLedger()
+        ledger.mark_range(self.key, 0, 100)
+        other_key = ledger_key("full", "1.19", 100, 25, 5000)
+        
+        self.assertEqual(ledger.uncovered(self.key, 50, 150), [(100, 150)])
+        self.assertEqual(ledger.uncovered(other_key, 50, 150), [(50, 150)])
+    
+    def test_save_and_merge(self):
+        """Test ledgers from several nodes merge into one"""
+        paths = [os.path.join(self.tmpdir, f"node{i}.json") for i in range(2)]
+        first = CoverageLedger(paths[0])
+        first.mark_range(self.key, 0, 100)
+        first.mark_seed(self.key, 999)
+        first.save()
+        second = CoverageLedger(paths[1])
+        second.mark_range(self.key, 100, 200)
+        second.save()
+        
+        output = os.path.join(self.tmpdir, "merged.json")
+        merge_ledgers(output, paths)
+        merged = CoverageLedger(output)
+        
+        self.assertEqual(merged.uncovered(self.key, 0, 300), [(200, 300)])
+        self.assertTrue(merged.is_covered(self.key, 999))
+        self.assertFalse(merged.is_covered(self.key, 1000))
+    
+    def test_concurrent_saves_keep_both(self):
+        """Test two ledgers sharing a file keep each other's coverage"""
+        path = os.path.join(self.tmpdir, "shared.json")
+        gui = CoverageLedger(path)
+        batch = CoverageLedger(path)
+        gui.mark_range(self.key, 0, 100)
+        batch.mark_range(self.key, 500, 600)
+        batch.mark_seed(self.key, 999)
+        
+        gui.save()
+        batch.save()
+        gui.save()
+        
+        saved = CoverageLedger(path)
+        self.assertEqual(saved.uncovered(self.key, 0, 600), [(100, 500)])
+        self.assertTrue(saved.is_covered(self.key, 999))
+        self.assertEqual(saved._seeds[self.key].count, 1)
+        self.assertFalse(os.path.exists(path + ".lock"))
+
+
+if __name__ == '__main__':
+    unittest.main()
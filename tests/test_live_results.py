@@ -0,0 +1,72 @@
+"""
+Unit tests for the shared-memory live result ring
+"""
+import multiprocessing
+import unittest
+from live_results import ResultRing
+
+
+def make_result(seed):
+    return {'seed': seed, 'x': seed * 10, 'z': -seed, 'house_count': 100 + seed,
+            'biome': 'minecraft:plains'}
+
+
+def produce(ring, first, count):
+    """Push results from another process"""
+    ring.push_many(make_result(seed) for seed in range(first, first + count))
+    ring.close()
+
+
+class TestResultRing(unittest.TestCase):
+    """Test ResultRing functionality"""
+    
+    def setUp(self):
+        self.ring = ResultRing(capacity=8)
+    
+    def tearDown(self):
+        self.ring.close()
+    
+    def test_push_and_poll(self):
+        """Test records come back in order and are only read once"""
+        self.ring.push_many(make_result(seed) for seed in range(3))
+        
+        self.assertEqual(self.ring.poll(max_records=2), [make_result(0), make_result(1)])
+        self.assertEqual(self.ring.poll(), [make_result(2)])
+        self.assertEqual(self.ring.poll(), [])
+        self.assertEqual(self.ring.written, 3)
+    
+    def test_wraps_around(self):
+        """Test slots are reused once the consumer catches up"""
+        for seed in range(20):
+            self.assertTrue(self.ring.push(make_result(seed)))
+            self.assertEqual(self.ring.poll(), [make_result(seed)])
+    
+    def test_overflow_drops_newest(self):
+        """Test a full ring drops and counts new records"""
+        for seed in range(10):
+            self.ring.push(make_result(seed))
+        
+        self.assertEqual(self.ring.dropped, 2)
+        self.assertEqual(self.ring.poll(), [make_result(seed) for seed in range(8)])
+        self.assertTrue(self.ring.push(make_result(99)))
+    
+    def test_multiple_processes(self):
+        """Test several worker processes publish into one ring"""
+        ring = ResultRing(capacity=64)
+        try:
+            workers = [multiprocessing.Process(target=produce, args=(ring, first, 10))
+                       for first in (0, 100, 200)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(timeout=30)
+            
+            seeds = sorted(result['seed'] for result in ring.poll())
+            self.assertEqual(seeds, list(range(10)) + list(range(100, 110)) +
+                             list(range(200, 210)))
+        finally:
+            ring.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
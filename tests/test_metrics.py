@@ -0,0 +1,82 @@
+"""
+Unit tests for search metrics
+"""
+import unittest
+import urllib.request
+from metrics import SearchMetrics, MetricsServer
+from score_cache import ScoreCache
+
+
+class TestSearchMetrics(unittest.TestCase):
+    """Test SearchMetrics functionality"""
+    
+    def test_render_counters(self):
+        """Test counters and histograms appear in the exposition format"""
+        metrics = SearchMetrics()
+        metrics.record_stage('candidates', 0.0005, calls=81)
+        metrics.record_stage('candidates', 20.0, calls=81)
+        metrics.record_seed(0.002, 3)
+        metrics.record_skipped(10)
+        
+        text = metrics.render()
+        self.assertIn("seedfinder_seeds_scanned_total 1", text)
+        self.assertIn("seedfinder_seeds_skipped_total 10", text)
+        self.assertIn("seedfinder_results_total 3", text)
+        self.assertIn('seedfinder_stage_calls_total{stage="candidates"} 162', text)
+        self.assertIn('seedfinder_stage_latency_seconds_bucket{stage="candidates",le="0.001"} 1',
+                      text)
+        self.assertIn('seedfinder_stage_latency_seconds_bucket{stage="candidates",le="+Inf"} 2',
+                      text)
+        self.assertIn('seedfinder_stage_latency_seconds_count{stage="seed"} 1', text)
+    
+    def test_render_cache_hit_ratio(self):
+        """Test score cache hit rates are reported"""
+        cache = ScoreCache()
+        cache.put("1.20.4", 1, 0, 0, 100, "minecraft:plains")
+        cache.get("1.20.4", 1, 0, 0)
+        cache.get("1.20.4", 2, 0, 0)
+        
+        text = SearchMetrics(cache).render()
+        self.assertIn("seedfinder_score_cache_hits_total 1", text)
+        self.assertIn("seedfinder_score_cache_hit_ratio 0.5000", text)
+    
+    def test_merge_worker_snapshot(self):
+        """Test stage timings and cache lookups from a worker reach the parent"""
+        cache = ScoreCache()
+        worker = SearchMetrics(cache)
+        worker.record_stage('viability', 0.002, calls=5)
+        cache.get("1.20.4", 1, 0, 0)
+        cache.put("1.20.4", 1, 0, 0, 100, "minecraft:plains")
+        cache.get("1.20.4", 1, 0, 0)
+        
+        parent = SearchMetrics()
+        parent.merge(worker.snapshot())
+        parent.merge(worker.snapshot())
+        
+        text = parent.render()
+        self.assertIn('seedfinder_stage_calls_total{stage="viability"} 5', text)
+        self.assertIn('seedfinder_stage_latency_seconds_count{stage="viability"} 1', text)
+        self.assertIn("seedfinder_score_cache_hits_total 1", text)
+        self.assertIn("seedfinder_score_cache_misses_total 1", text)
+
+
+class TestMetricsServer(unittest.TestCase):
+    """Test MetricsServer functionality"""
+    
+    def test_scrape(self):
+        """Test metrics can be scraped over HTTP on localhost"""
+        metrics = SearchMetrics()
+        metrics.record_seed(0.01, 2)
+        server = MetricsServer(metrics, port=0).start()
+        
+        try:
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                body = response.read().decode('utf-8')
+            self.assertEqual(server.host, "127.0.0.1")
+            self.assertIn("seedfinder_results_total 2", body)
+        finally:
+            server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Unit tests for pipelined stage execution
+"""
+import threading
+import unittest
+from unittest.mock import patch
+from seedfinder import SeedFinder, FastSeedFinder
+from pipeline import PipelineRunner
+from tests.fakes import fake_structure_pos, fake_is_viable
+
+
+class TestPipelineRunner(unittest.TestCase):
+    """Test PipelineRunner functionality"""
+    
+    @patch('seedfinder.get_biome_id', return_value="minecraft:plains")
+    @patch('seedfinder.is_viable_structure_pos', side_effect=fake_is_viable)
+    @patch('seedfinder.get_structure_pos', side_effect=fake_structure_pos)
+    def test_matches_sequential(self, mock_get_pos, mock_is_viable, mock_get_biome):
+        """Test the pipeline returns the same results in the same order"""
+        finder = SeedFinder("1.20.4")
+        expected = finder.search_seeds(0, 40, min_houses=60, search_radius=600)
+        
+        progress = []
+        results = finder.search_seeds(
+            0, 40, min_houses=60, search_radius=600,
+            progress_callback=lambda p, n: progress.append(p),
+            runner=PipelineRunner(viability_workers=3, scoring_workers=2, queue_size=2)
+        )
+        
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(results, expected)
+        self.assertEqual(len(progress), 40)
+        self.assertEqual(progress[-1], 100.0)
+    
+    @patch('seedfinder.get_biome_id', return_value="minecraft:plains")
+    @patch('seedfinder.is_viable_structure_pos', side_effect=fake_is_viable)
+    @patch('seedfinder.get_structure_pos', side_effect=fake_structure_pos)
+    def test_stop_reports_contiguous_prefix(self, mock_get_pos, mock_is_viable,
+                                            mock_get_biome):
+        """Test a stopped pipeline reports the seeds it finished, in order"""
+        stop = threading.Event()
+        blocks = []
+        
+        def on_done(start, end, hits):
+            blocks.append(start)
+            if start == 10:
+                stop.set()
+        
+        PipelineRunner(queue_size=2, stop=stop).run(
+            SeedFinder("1.20.4"), "full", [(0, 10000)], 60, 25, 600, on_done
+        )
+        
+        self.assertEqual(blocks, list(range(len(blocks))))
+        self.assertLess(len(blocks), 10000)
+    
+    @patch('seedfinder.get_biome_id', return_value="minecraft:desert")
+    @patch('seedfinder.is_viable_structure_pos', side_effect=fake_is_viable)
+    @patch('seedfinder.get_structure_pos', side_effect=fake_structure_pos)
+    def test_48bit_mode(self, mock_get_pos, mock_is_viable, mock_get_biome):
+        """Test 48-bit searches keep their result format"""
+        finder = FastSeedFinder("1.20.4")
+        start = 1 << 48
+        expected = finder.search_lower_48_bits(start, start + 10, min_houses=60,
+                                               search_radius=600)
+        results = finder.search_lower_48_bits(start, start + 10, min_houses=60,
+                                              search_radius=600, runner=PipelineRunner())
+        
+        self.assertEqual(results, expected)
+        self.assertTrue(all(r['seed_48bit'] < start for r in results))
+    
+    @patch('seedfinder.get_biome_id', return_value="minecraft:plains")
+    @patch('seedfinder.is_viable_structure_pos', return_value=True)
+    @patch('seedfinder.get_structure_pos', return_value=(10, 10))
+    def test_stage_error_propagates(self, mock_get_pos, mock_is_viable, mock_get_biome):
+        """Test an error in a stage stops the pipeline and is raised"""
+        finder = SeedFinder("1.20.4")
+        
+        with patch.object(SeedFinder, '_score_positions', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                finder.search_seeds(0, 100, search_radius=600, runner=PipelineRunner())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for multi-structure constraint queries
+"""
+import unittest
+from unittest.mock import patch
+from seedfinder import SeedFinder
+from query import BiomeConstraint, ConstraintQuery, StructureConstraint
+
+
+VILLAGES = [(100, 200), (3000, 3000)]
+
+
+def outpost_pos(structure, seed, mc_version, region_x, region_z):
+    """An outpost attempt only in region (0, 0), near the first village"""
+    return (10, 10) if (region_x, region_z) == (0, 0) else None
+
+
+@patch.object(SeedFinder, '_candidate_positions', return_value=VILLAGES)
+@patch('query.get_structure_pos', side_effect=outpost_pos)
+class TestConstraintQuery(unittest.TestCase):
+    """Test ConstraintQuery functionality"""
+
+    def setUp(self):
+        self.query = ConstraintQuery([StructureConstraint("PILLAGER_OUTPOST", 1000)])
+        self.finder = SeedFinder("1.20.4", query=self.query)
+
+    @patch('seedfinder.get_biome_id', return_value="minecraft:plains")
+    @patch('seedfinder.is_viable_structure_pos', return_value=True)
+    @patch('query.is_viable_structure_pos', return_value=True)
+    def test_village_viability_after_constraints(self, mock_outpost_viable,
+                                                 mock_village_viable, mock_biome,
+                                                 mock_get_pos, mock_candidates):
+        """Test only villages passing every constraint reach viability and scoring"""
+        results = self.finder.find_mega_villages(12345, min_houses=1)
+
+        self.assertEqual([(r['x'], r['z']) for r in results], [(100, 200)])
+        self.assertEqual(mock_village_viable.call_count, 1)
+        self.assertEqual(mock_outpost_viable.call_count, 1)
+
+        # Each region near a village is looked up once
+        regions = [call.args[3:] for call in mock_get_pos.call_args_list]
+        self.assertEqual(len(regions), len(set(regions)))
+
+    @patch('seedfinder.is_viable_structure_pos', return_value=True)
+    @patch('query.is_viable_structure_pos', return_value=False)
+    def test_rejects_structures_that_do_not_generate(self, mock_outpost_viable,
+                                                      mock_village_viable,
+                                                      mock_get_pos, mock_candidates):
+        """Test a failed structure viability check skips village work entirely"""
+        self.assertEqual(self.finder.find_mega_villages(12345, min_houses=1), [])
+        mock_village_viable.assert_not_called()
+
+    @patch('seedfinder.is_viable_structure_pos', return_value=True)
+    @patch('query.is_viable_structure_pos', return_value=True)
+    @patch('query.get_biome_id', return_value="minecraft:desert")
+    def test_biome_constraint(self, mock_biome, mock_outpost_viable,
+                              mock_village_viable, mock_get_pos, mock_candidates):
+        """Test villages outside the allowed biomes are rejected"""
+        query = ConstraintQuery([StructureConstraint("PILLAGER_OUTPOST", 1000)],
+                                [BiomeConstraint({"minecraft:plains"})])
+        finder = SeedFinder("1.20.4", query=query)
+
+        self.assertEqual(finder.find_mega_villages(12345, min_houses=1), [])
+        self.assertEqual(mock_biome.call_count, 1)
+        mock_village_viable.assert_not_called()
+
+    @patch('query.is_viable_structure_pos', side_effect=RuntimeError("unsupported version"))
+    def test_lookup_errors_propagate(self, mock_outpost_viable, mock_get_pos, mock_candidates):
+        """Test lookup errors fail the search instead of reporting no villages"""
+        with self.assertRaises(RuntimeError):
+            self.finder.find_mega_villages(12345, min_houses=1)
+    
+    def test_cheapest_first_and_key(self, mock_get_pos, mock_candidates):
+        """Test constraints are ordered by cost and keyed independently of order"""
+        portal = StructureConstraint("RUINED_PORTAL", 1000)
+        outpost = StructureConstraint("PILLAGER_OUTPOST", 4000)
+        query = ConstraintQuery([outpost, portal])
+
+        self.assertEqual(query.structures, [portal, outpost])
+        self.assertEqual(query.key, ConstraintQuery([portal, outpost]).key)
+        self.assertNotEqual(self.finder._ledger_key("full", 100, 25, 5000),
+                            SeedFinder("1.20.4")._ledger_key("full", 100, 25, 5000))
+
+    def test_invalid_constraints(self, mock_get_pos, mock_candidates):
+        """Test unknown structures and distance ranges are rejected"""
+        with self.assertRaises(ValueError):
+            StructureConstraint("NOT_A_STRUCTURE", 1000)
+        with self.assertRaises(ValueError):
+            StructureConstraint("PILLAGER_OUTPOST", 100, min_distance=200)
+        with self.assertRaises(ValueError):
+            BiomeConstraint([])
+
+
+if __name__ == '__main__':
+    unittest.main()
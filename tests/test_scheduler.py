@@ -0,0 +1,112 @@
+"""
+Unit tests for adaptive chunk scheduling
+"""
+import multiprocessing
+import threading
+import unittest
+from unittest.mock import patch
+from seedfinder import SeedFinder, FastSeedFinder
+from scheduler import AdaptiveScheduler, _Worker
+from tests.fakes import fake_structure_pos, fake_is_viable
+
+
+class TestAdaptiveScheduler(unittest.TestCase):
+    """Test AdaptiveScheduler functionality"""
+    
+    def test_partition(self):
+        """Test shares are contiguous, equal and cover every seed"""
+        scheduler = AdaptiveScheduler(workers=3)
+        workers = scheduler.partition([(0, 5), (10, 20)])
+        
+        self.assertEqual([list(w.ranges) for w in workers],
+                         [[(0, 5)], [(10, 15)], [(15, 20)]])
+    
+    def test_chunk_size_targets_latency(self):
+        """Test chunk sizes follow the measured cost per seed"""
+        scheduler = AdaptiveScheduler(workers=1, target_latency=0.5, initial_chunk=8,
+                                      max_chunk=1000)
+        worker = _Worker([(0, 100000)])
+        self.assertEqual(scheduler.chunk_size(worker), 8)
+        worker.seconds_per_seed = 0.01
+        self.assertEqual(scheduler.chunk_size(worker), 50)
+        worker.seconds_per_seed = 0.000001
+        self.assertEqual(scheduler.chunk_size(worker), 1000)
+        worker.seconds_per_seed = 10.0
+        self.assertEqual(scheduler.chunk_size(worker), 1)
+    
+    def test_steal_back_half(self):
+        """Test an idle worker steals the back half of the largest share"""
+        scheduler = AdaptiveScheduler(workers=3)
+        idle = _Worker([])
+        busy = _Worker([(0, 10), (20, 30)])
+        small = _Worker([(40, 42)])
+        
+        self.assertEqual(scheduler.next_chunk(idle, [idle, busy, small]), (20, 28))
+        self.assertEqual(list(busy.ranges), [(0, 10)])
+        self.assertEqual(list(idle.ranges), [(28, 30)])
+        self.assertEqual(scheduler.steals, 1)
+        
+        empty = _Worker([])
+        self.assertIsNone(scheduler.next_chunk(empty, [empty]))
+    
+    @patch('seedfinder.get_biome_id', return_value="minecraft:plains")
+    @patch('seedfinder.is_viable_structure_pos', side_effect=fake_is_viable)
+    @patch('seedfinder.get_structure_pos', side_effect=fake_structure_pos)
+    def test_matches_sequential(self, mock_get_pos, mock_is_viable, mock_get_biome):
+        """Test parallel results are identical and progress reaches 100%"""
+        finder = SeedFinder("1.20.4")
+        expected = finder.search_seeds(0, 60, min_houses=60, search_radius=600)
+        
+        progress = []
+        scheduler = AdaptiveScheduler(workers=4, initial_chunk=3, use_processes=False)
+        results = finder.search_seeds(0, 60, min_houses=60, search_radius=600,
+                                      progress_callback=lambda p, n: progress.append(p),
+                                      runner=scheduler)
+        
+        self.assertEqual(results, expected)
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(progress[-1], 100.0)
+    
+    @patch('seedfinder.get_biome_id', return_value="minecraft:plains")
+    @patch('seedfinder.is_viable_structure_pos', side_effect=fake_is_viable)
+    @patch('seedfinder.get_structure_pos', side_effect=fake_structure_pos)
+    def test_stop_cancels_remaining_chunks(self, mock_get_pos, mock_is_viable,
+                                           mock_get_biome):
+        """Test setting the stop event ends the search after running chunks"""
+        stop = threading.Event()
+        scheduler = AdaptiveScheduler(workers=2, initial_chunk=5, use_processes=False,
+                                      stop=stop)
+        blocks = []
+        
+        def on_done(start, end, hits):
+            blocks.append((start, end))
+            stop.set()
+        
+        scheduler.run(SeedFinder("1.20.4"), "full", [(0, 1000)], 60, 25, 600, on_done)
+        
+        self.assertLessEqual(len(blocks), 2)
+        self.assertLess(sum(end - start for start, end in blocks), 1000)
+    
+    @patch('seedfinder.get_biome_id', return_value="minecraft:plains")
+    @patch('seedfinder.is_viable_structure_pos', side_effect=fake_is_viable)
+    @patch('seedfinder.get_structure_pos', side_effect=fake_structure_pos)
+    def test_worker_processes(self, mock_get_pos, mock_is_viable, mock_get_biome):
+        """Test 48-bit searches in worker processes keep their results"""
+        # Workers only see the mocks when forked, spawned ones would import cubiomes
+        if "fork" not in multiprocessing.get_all_start_methods():
+            self.skipTest("fork start method unavailable")
+        scheduler = AdaptiveScheduler(workers=2, mp_context=multiprocessing.get_context("fork"))
+        finder = FastSeedFinder("1.20.4")
+        expected = finder.search_lower_48_bits(0, 20, min_houses=60, search_radius=600)
+        
+        try:
+            results = finder.search_lower_48_bits(0, 20, min_houses=60, search_radius=600,
+                                                  runner=scheduler)
+        except (OSError, PermissionError) as e:
+            self.skipTest(f"Worker processes unavailable: {e}")
+        
+        self.assertEqual(results, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Unit tests for the persistent score cache
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from score_cache import ScoreCache
+
+
+class TestScoreCache(unittest.TestCase):
+    """Test ScoreCache functionality"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "scores.db")
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    
+    def test_memory_cache(self):
+        """Test in-memory cache lookups and hit counting"""
+        cache = ScoreCache()
+        self.assertIsNone(cache.get("1.20.4", 1, 2, 3))
+        cache.put("1.20.4", 1, 2, 3, 120, "minecraft:plains")
+        
+        self.assertEqual(cache.get("1.20.4", 1, 2, 3), (120, "minecraft:plains"))
+        self.assertIsNone(cache.get("1.19", 1, 2, 3))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(len(cache), 1)
+    
+    def test_persistence(self):
+        """Test scores survive reopening the cache"""
+        cache = ScoreCache(self.path)
+        cache.put("1.20.4", 1, 2, 3, 120, "minecraft:plains")
+        cache.close()
+        
+        reopened = ScoreCache(self.path)
+        self.assertEqual(reopened.get("1.20.4", 1, 2, 3), (120, "minecraft:plains"))
+        self.assertEqual(len(reopened), 1)
+        reopened.close()
+    
+    def test_memory_limit(self):
+        """Test evicted scores are still served from disk"""
+        cache = ScoreCache(self.path, commit_interval=1000, memory_limit=2)
+        for x in range(5):
+            cache.put("1.20.4", 1, x, 0, 100 + x, "minecraft:plains")
+        
+        self.assertEqual(cache.get("1.20.4", 1, 0, 0), (100, "minecraft:plains"))
+        self.assertEqual(len(cache), 5)
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,16 @@
 """
 Unit tests for SeedFinder
 """
+import json
+import os
+import tempfile
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
-from seedfinder import SeedFinder, FastSeedFinder
+from seedfinder import SeedFinder, FastSeedFinder, SequentialRunner
+from score_cache import ScoreCache
+from exporters import JSONLExporter
+from ledger import CoverageLedger, ledger_key
 
 
 class TestSeedFinder(unittest.TestCase):
@@ -52,6 +59,147 @@ class TestSeedFinder(unittest.TestCase):
         self.assertGreater(size, 0)
         self.assertLess(size, 150)
     
+    @patch('seedfinder.get_biome_id')
+    def test_estimate_village_size_deterministic(self, mock_get_biome):
+        """Test village size is a pure function of version, seed and position"""
+        mock_get_biome.return_value = "minecraft:plains"
+        
+        sizes = {self.finder.estimate_village_size(12345, 100, 200) for _ in range(5)}
+        self.assertEqual(len(sizes), 1)
+        self.assertEqual(SeedFinder("1.20.4").estimate_village_size(12345, 100, 200),
+                         sizes.pop())
+    
+    @patch('seedfinder.get_biome_id')
+    def test_score_village_uses_cache(self, mock_get_biome):
+        """Test cached villages skip biome lookups"""
+        mock_get_biome.return_value = "minecraft:desert"
+        finder = SeedFinder("1.20.4", ScoreCache())
+        
+        first = finder.score_village(12345, 100, 200)
+        second = finder.score_village(12345, 100, 200)
+        self.assertEqual(first, second)
+        self.assertEqual(first[1], "minecraft:desert")
+        self.assertEqual(mock_get_biome.call_count, 1)
+        self.assertEqual(finder.score_cache.hits, 1)
+    
+    @patch('seedfinder.get_biome_id')
+    @patch('seedfinder.is_viable_structure_pos')
+    @patch('seedfinder.get_structure_pos')
+    def test_find_mega_villages_scores_once(self, mock_get_pos, mock_is_viable,
+                                            mock_get_biome):
+        """Test the cluster pass reuses single-village scores"""
+        mock_get_pos.side_effect = lambda s, seed, v, rx, rz: (rx * 250, rz * 250)
+        mock_is_viable.return_value = True
+        mock_get_biome.return_value = "minecraft:plains"
+        
+        results = self.finder.find_mega_villages(12345, min_houses=50, search_radius=600)
+        singles = [r for r in results if not r.get('is_cluster')]
+        clusters = [r for r in results if r.get('is_cluster')]
+        
+        self.assertEqual(mock_get_biome.call_count, 16)
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0]['house_count'],
+                         sum(r['house_count'] for r in singles))
+    
+    @patch.object(SeedFinder, 'find_mega_villages')
+    def test_search_seeds_skips_covered(self, mock_find):
+        """Test seeds recorded in the ledger are not searched again"""
+        mock_find.return_value = []
+        ledger = CoverageLedger()
+        key = ledger_key("full", "1.20.4", 100, 25, 5000)
+        ledger.mark_range(key, 0, 50)
+        progress = []
+        
+        self.finder.search_seeds(0, 100, ledger=ledger,
+                                 progress_callback=lambda p, n: progress.append(p))
+        
+        searched = [call.args[0] for call in mock_find.call_args_list]
+        self.assertEqual(searched, list(range(50, 100)))
+        self.assertEqual(progress[0], 51.0)
+        self.assertEqual(ledger.uncovered(key, 0, 100), [])
+        self.assertEqual(self.finder.count_searched(ledger, 0, 150, 100, 25, 5000), 100)
+        self.assertEqual(self.finder.count_searched(ledger, 0, 150, 100, 25, 5000, "48bit"), 0)
+    
+    @patch.object(SeedFinder, 'find_mega_villages')
+    def test_interrupted_search_saves_ledger(self, mock_find):
+        """Test coverage of completed seeds is saved when a search fails midway"""
+        mock_find.side_effect = lambda seed, *args: [] if seed < 5 else 1 / 0
+        key = ledger_key("full", "1.20.4", 100, 25, 5000)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ledger.json")
+            with self.assertRaises(ZeroDivisionError):
+                self.finder.search_seeds(0, 10, ledger=CoverageLedger(path))
+            
+            self.assertEqual(CoverageLedger(path).uncovered(key, 0, 10), [(5, 10)])
+    
+    @patch('seedfinder.get_biome_id', side_effect=RuntimeError("unsupported version"))
+    @patch('seedfinder.is_viable_structure_pos', return_value=True)
+    @patch('seedfinder.get_structure_pos', return_value=(100, 200))
+    def test_failed_lookup_not_covered(self, mock_get_pos, mock_is_viable, mock_biome):
+        """Test a seed whose lookups fail fails the search and is not marked searched"""
+        ledger = CoverageLedger()
+        key = ledger_key("full", "1.20.4", 100, 25, 5000)
+        
+        with self.assertRaises(RuntimeError):
+            self.finder.search_seeds(0, 10, ledger=ledger)
+        with self.assertRaises(RuntimeError):
+            self.finder.search_seed_list([5], ledger=ledger)
+        
+        self.assertEqual(ledger.uncovered(key, 0, 10), [(0, 10)])
+        self.assertEqual(self.finder.score_village(12345, 100, 200), (10, "unknown"))
+    
+    @patch('seedfinder._cubiomes', side_effect=ImportError("No module named 'cubiomes'"))
+    @patch.object(SeedFinder, 'find_mega_villages')
+    def test_missing_cubiomes_fails_search(self, mock_find, mock_cubiomes):
+        """Test a missing cubiomes fails the search before any seed is searched"""
+        finder = SeedFinder("1.20.4-missing-bindings")
+        ledger = CoverageLedger()
+        
+        with self.assertRaises(ImportError):
+            finder.search_seeds(0, 10, ledger=ledger)
+        
+        mock_find.assert_not_called()
+        self.assertEqual(ledger.keys(), [])
+    
+    @patch('seedfinder.LEDGER_SAVE_INTERVAL', 0)
+    @patch.object(SeedFinder, 'find_mega_villages')
+    def test_results_written_before_coverage(self, mock_find):
+        """Test every periodic ledger save follows a flush of the seeds' results"""
+        mock_find.side_effect = lambda seed, *args: [{'seed': seed, 'x': 0, 'z': 0}]
+        key = ledger_key("full", "1.20.4", 100, 25, 5000)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ledger.json")
+            output = os.path.join(tmp, "out.jsonl")
+            with JSONLExporter(output, batch_size=1000) as exporter:
+                ledger = CoverageLedger(path, before_save=exporter.flush)
+                saved = []
+                
+                def check_save(save=ledger.save):
+                    save()
+                    with open(output) as f:
+                        written = {json.loads(line)['seed'] for line in f}
+                    on_disk = CoverageLedger(path)
+                    covered = {seed for seed in range(50) if on_disk.is_covered(key, seed)}
+                    saved.append(covered <= written)
+                
+                ledger.save = check_save
+                self.finder.search_seeds(0, 50, ledger=ledger,
+                                         result_callback=exporter.write_many)
+            
+            self.assertEqual(len(saved), 51)
+            self.assertTrue(all(saved))
+    
+    @patch.object(SeedFinder, 'find_mega_villages')
+    def test_sequential_runner_stop(self, mock_find):
+        """Test a set stop event ends a sequential search after the current seed"""
+        stop = threading.Event()
+        mock_find.side_effect = lambda seed, *args: stop.set() or []
+        
+        self.finder.search_seeds(0, 100, runner=SequentialRunner(stop=stop))
+        self.assertEqual(mock_find.call_count, 1)
+    
     def test_check_spacing_empty(self):
         """Test spacing check with no positions"""
         result = self.finder.check_spacing([])
@@ -78,6 +226,14 @@ class TestFastSeedFinder(unittest.TestCase):
     def test_inheritance(self):
         """Test that FastSeedFinder inherits from SeedFinder"""
         self.assertIsInstance(self.finder, SeedFinder)
+    
+    @patch.object(SeedFinder, 'find_mega_villages')
+    def test_search_lower_48_bits_masks_seed(self, mock_find):
+        """Test 48-bit search masks seeds and records the masked seed"""
+        mock_find.side_effect = lambda seed, *args: [{'seed': seed}]
+        
+        results = self.finder.search_lower_48_bits((1 << 48) + 5, (1 << 48) + 6)
+        self.assertEqual(results, [{'seed': 5, 'seed_48bit': 5, 'full_seed': None}])
 
 
 if __name__ == '__main__':
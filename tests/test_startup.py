@@ -0,0 +1,59 @@
+"""
+Unit tests for import-time cost of the core modules
+"""
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold import budget in seconds, generous enough for slow CI machines
+IMPORT_BUDGET = 0.5
+
+HEAVY_MODULES = ('numpy', 'cubiomes', 'PyQt5')
+
+
+def import_in_subprocess(module: str) -> dict:
+    """Import a module in a fresh interpreter, returning its cost and what it loaded"""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [name for name in {HEAVY_MODULES!r} if name in sys.modules]\n"
+        "print(json.dumps({'seconds': elapsed, 'heavy': heavy}))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+class TestStartup(unittest.TestCase):
+    """Test heavy dependencies load on first use only"""
+
+    def test_seedfinder_import(self):
+        """Test importing seedfinder is fast and skips numpy and cubiomes"""
+        result = import_in_subprocess("seedfinder")
+
+        self.assertEqual(result['heavy'], [])
+        self.assertLess(result['seconds'], IMPORT_BUDGET)
+
+    def test_worker_modules_import(self):
+        """Test modules loaded by worker processes stay light"""
+        for module in ("scheduler", "verify", "exporters"):
+            result = import_in_subprocess(module)
+            self.assertEqual(result['heavy'], [], module)
+            self.assertLess(result['seconds'], IMPORT_BUDGET, module)
+
+    def test_main_skips_qt(self):
+        """Test the entry module does not load PyQt5 until the GUI starts"""
+        result = import_in_subprocess("main")
+
+        self.assertEqual(result['heavy'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
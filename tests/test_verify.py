@@ -0,0 +1,76 @@
+"""
+Unit tests for bulk re-verification
+"""
+import unittest
+from unittest.mock import patch
+import verify
+from seedfinder import SeedFinder
+from verify import group_by_seed, verify_results
+
+
+class TestVerify(unittest.TestCase):
+    """Test verification of exported results"""
+    
+    def make_hit(self, seed, x, z):
+        """Build an export entry matching the current scoring"""
+        with patch('seedfinder.get_biome_id', return_value="minecraft:plains"):
+            house_count, biome = SeedFinder("1.20.4").score_village(seed, x, z)
+        return {'seed': seed, 'x': x, 'z': z, 'house_count': house_count, 'biome': biome}
+    
+    def test_group_by_seed(self):
+        """Test hits are grouped by seed"""
+        hits = [{'seed': 1}, {'seed': 2}, {'seed': 1}]
+        groups = group_by_seed(hits)
+        self.assertEqual(list(groups), [1, 2])
+        self.assertEqual(len(groups[1]), 2)
+    
+    @patch('seedfinder.get_biome_id')
+    @patch('seedfinder.is_viable_structure_pos')
+    def test_verify_results(self, mock_is_viable, mock_get_biome):
+        """Test hits are classified as confirmed, changed or rejected"""
+        mock_get_biome.return_value = "minecraft:plains"
+        mock_is_viable.side_effect = lambda s, v, seed, x, z, d: x != 0
+        
+        confirmed = self.make_hit(1, 100, 200)
+        changed = dict(self.make_hit(1, 300, 200), house_count=1)
+        rejected = dict(self.make_hit(2, 0, 0), house_count=200)
+        
+        report = verify_results([confirmed, changed, rejected], "1.20.4",
+                                min_houses=10, workers=1)
+        
+        self.assertEqual(report['confirmed'], [confirmed])
+        self.assertEqual(report['changed'][0]['hit'], changed)
+        self.assertEqual(report['rejected'][0]['reason'], 'not viable')
+        self.assertEqual(report['stats']['seeds'], 2)
+        self.assertEqual(report['stats']['hits'], 3)
+    
+    @patch('seedfinder.get_biome_id')
+    @patch('seedfinder.is_viable_structure_pos')
+    def test_verify_below_threshold(self, mock_is_viable, mock_get_biome):
+        """Test hits that no longer reach the threshold are rejected"""
+        mock_get_biome.return_value = "minecraft:plains"
+        mock_is_viable.return_value = True
+        
+        report = verify_results([self.make_hit(1, 100, 200)], "1.20.4",
+                                min_houses=500, workers=1)
+        
+        self.assertEqual(report['rejected'][0]['reason'], 'below threshold')
+    
+    @patch('seedfinder.get_biome_id')
+    @patch('seedfinder.is_viable_structure_pos')
+    @patch('verify.ScoreCache')
+    def test_in_process_closes_cache(self, mock_cache, mock_is_viable, mock_get_biome):
+        """Test in-process verification closes its score cache and keeps no globals"""
+        mock_get_biome.return_value = "minecraft:plains"
+        mock_is_viable.return_value = True
+        mock_cache.return_value.get.return_value = None
+        
+        verify_results([self.make_hit(1, 100, 200)], "1.20.4", min_houses=10,
+                       workers=1, cache_path="scores.db")
+        
+        mock_cache.return_value.close.assert_called_once()
+        self.assertIsNone(verify._worker_finder)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+"""
+Minecraft SeedFinder - Bulk re-verification of exported results
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from exporters import load_results
+from score_cache import ScoreCache
+from seedfinder import SeedFinder
+
+
+CONFIRMED = 'confirmed'
+CHANGED = 'changed'
+REJECTED = 'rejected'
+
+# Finder reused by every task a worker process runs
+_worker_finder = None
+
+
+def group_by_seed(results: List[dict]) -> Dict[int, List[dict]]:
+    """Group exported hits by seed, preserving their order"""
+    groups = {}
+    for result in results:
+        groups.setdefault(result['seed'], []).append(result)
+    return groups
+
+
+def _init_worker(mc_version: str, cache_path: Optional[str]):
+    """Create the per-process finder"""
+    global _worker_finder
+    cache = ScoreCache(cache_path) if cache_path else None
+    _worker_finder = SeedFinder(mc_version, cache)
+
+
+def _verify_batch(finder: Optional[SeedFinder], batch: List[Tuple[int, List[dict]]],
+                  min_houses: int, max_spacing: int, search_radius: int) -> List[tuple]:
+    """Verify a batch of seed groups, with the worker process's finder if none is given"""
+    if finder is None:
+        finder = _worker_finder
+    outcomes = []
+    for seed, hits in batch:
+        outcomes.extend(verify_seed(finder, seed, hits, min_houses,
+                                    max_spacing, search_radius))
+    if finder.score_cache is not None:
+        finder.score_cache.flush()
+    return outcomes
+
+
+def verify_seed(finder: SeedFinder, seed: int, hits: List[dict], min_houses: int = 100,
+                max_spacing: int = 25, search_radius: int = 5000) -> List[tuple]:
+    """
+    Re-evaluate the recorded hits of a single seed
+
+    Single villages are only re-checked at their recorded coordinates.
+    Cluster hits do not record their member villages, so they fall back to
+    a full search of the seed, done at most once per seed.
+
+    Args:
+        finder: SeedFinder for the target version
+        seed: Minecraft world seed
+        hits: Exported hits for this seed
+        min_houses: Minimum house count threshold
+        max_spacing: Maximum spacing between houses
+        search_radius: Search radius used for cluster hits
+
+    Returns:
+        List of (status, hit, current, reason) tuples
+    """
+    outcomes = []
+    clusters = None
+
+    for hit in hits:
+        try:
+            if hit.get('is_cluster'):
+                if clusters is None:
+                    clusters = [village for village in finder.find_mega_villages(
+                                    seed, min_houses, max_spacing, search_radius)
+                                if village.get('is_cluster')]
+                current = clusters[0] if clusters else None
+                reason = 'cluster not found'
+            else:
+                current = finder.evaluate_village(seed, hit['x'], hit['z'])
+                reason = 'not viable'
+        except Exception as e:
+            outcomes.append((REJECTED, hit, None, f"error: {e}"))
+            continue
+
+        if current is None:
+            outcomes.append((REJECTED, hit, None, reason))
+        elif current['house_count'] < min_houses:
+            outcomes.append((REJECTED, hit, current, 'below threshold'))
+        elif (current['x'], current['z'], current['house_count'], current['biome']) == \
+                (hit['x'], hit['z'], hit['house_count'], hit['biome']):
+            outcomes.append((CONFIRMED, hit, current, None))
+        else:
+            outcomes.append((CHANGED, hit, current, None))
+
+    return outcomes
+
+
+def verify_results(results, mc_version: str, min_houses: int = 100, max_spacing: int = 25,
+                   search_radius: int = 5000, workers: Optional[int] = None,
+                   batch_size: int = 64, cache_path: Optional[str] = None,
+                   progress_callback=None) -> dict:
+    """
+    Re-verify exported hits, grouped by seed and checked in parallel
+
+    Args:
+        results: List of result dictionaries or a path to an export
+        mc_version: Minecraft version to verify against
+        min_houses: Minimum house count threshold
+        max_spacing: Maximum spacing between houses
+        search_radius: Search radius used for cluster hits
+        workers: Number of worker processes (1 verifies in-process)
+        batch_size: Number of seeds handed to a worker at a time
+        cache_path: Optional score cache; leave unset after upgrading cubiomes
+        progress_callback: Optional callback function for progress updates
+
+    Returns:
+        Report dictionary with confirmed, changed and rejected hits and stats
+    """
+    if isinstance(results, str):
+        results = load_results(results)
+
+    groups = list(group_by_seed(results).items())
+    batches = [groups[i:i + batch_size] for i in range(0, len(groups), batch_size)]
+    report = {CONFIRMED: [], CHANGED: [], REJECTED: []}
+    start_time = time.perf_counter()
+    done = 0
+
+    def collect(outcomes):
+        nonlocal done
+        for status, hit, current, reason in outcomes:
+            if status == CONFIRMED:
+                report[CONFIRMED].append(hit)
+            elif status == CHANGED:
+                report[CHANGED].append({'hit': hit, 'current': current})
+            else:
+                report[REJECTED].append({'hit': hit, 'current': current, 'reason': reason})
+        done += len(outcomes)
+        if progress_callback:
+            progress_callback(done / len(results) * 100, done)
+
+    args = (min_houses, max_spacing, search_radius)
+    if workers == 1 or len(batches) <= 1:
+        cache = ScoreCache(cache_path) if cache_path else None
+        finder = SeedFinder(mc_version, cache)
+        try:
+            for batch in batches:
+                collect(_verify_batch(finder, batch, *args))
+        finally:
+            if cache is not None:
+                cache.close()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(mc_version, cache_path)) as executor:
+            futures = [executor.submit(_verify_batch, None, batch, *args) for batch in batches]
+            for future in futures:
+                collect(future.result())
+
+    elapsed = time.perf_counter() - start_time
+    report['stats'] = {
+        'seeds': len(groups),
+        'hits': len(results),
+        'confirmed': len(report[CONFIRMED]),
+        'changed': len(report[CHANGED]),
+        'rejected': len(report[REJECTED]),
+        'elapsed': elapsed,
+        'seeds_per_sec': len(groups) / elapsed if elapsed > 0 else 0.0,
+        'hits_per_sec': len(results) / elapsed if elapsed > 0 else 0.0
+    }
+
+    return report
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Re-verify exported SeedFinder results")
+    parser.add_argument("export", help="Export file (.json, .jsonl, .csv or .sfr)")
+    parser.add_argument("--version", required=True, dest="mc_version",
+                        help="Minecraft version to verify against")
+    parser.add_argument("--min-houses", type=int, default=100)
+    parser.add_argument("--max-spacing", type=int, default=25)
+    parser.add_argument("--search-radius", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--cache", help="Score cache to reuse between runs")
+    parser.add_argument("--report", help="Write the full report as JSON")
+    args = parser.parse_args(argv)
+
+    report = verify_results(args.export, args.mc_version, args.min_houses,
+                            args.max_spacing, args.search_radius, args.workers,
+                            cache_path=args.cache)
+    stats = report['stats']
+
+    print(f"Verified {stats['hits']} hits across {stats['seeds']} seeds "
+          f"in {stats['elapsed']:.2f}s ({stats['hits_per_sec']:.1f} hits/s)")
+    print(f"  Confirmed: {stats['confirmed']}")
+    print(f"  Changed:   {stats['changed']}")
+    print(f"  Rejected:  {stats['rejected']}")
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return 0 if stats['changed'] == 0 and stats['rejected'] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())